@@ -3,7 +3,7 @@
 Debug script to analyze Dice.com structure with Selenium
 """
 
-import time
+import os
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -13,6 +13,84 @@ from selenium.common.exceptions import TimeoutException
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.chrome.service import Service
 
+# Runs every selector probe inside the page so a whole list costs one
+# WebDriver round-trip instead of find_elements + outerHTML + text each
+_PROBE_SELECTORS_JS = """
+return arguments[0].map(function (selector) {
+    var elements;
+    try {
+        elements = document.querySelectorAll(selector);
+    } catch (e) {
+        return {error: String(e)};
+    }
+    var result = {count: elements.length, html: '', text: '', testids: []};
+    try {
+        var first = elements[0];
+        if (first) {
+            // SVG and other non-HTML elements have no innerText
+            result.html = (first.outerHTML || '').slice(0, 500);
+            result.text = (first.innerText || first.textContent || '').slice(0, 200);
+        }
+        result.testids = Array.prototype.slice.call(elements, 0, 5).map(function (el) {
+            return el.getAttribute('data-testid');
+        });
+    } catch (e) {
+        // Keep the count even when describing the first match fails
+        result.error = String(e);
+    }
+    return result;
+});
+"""
+
+# Collects the first few job detail links with their parent markup in one call
+_JOB_LINKS_JS = """
+var links = document.querySelectorAll("a[href*='/jobs/detail/']");
+return {
+    count: links.length,
+    links: Array.prototype.slice.call(links, 0, arguments[0]).map(function (a) {
+        return {
+            href: a.href,
+            text: a.innerText,
+            parent: a.parentElement ? a.parentElement.outerHTML.slice(0, 200) : ''
+        };
+    })
+};
+"""
+
+_JOB_SELECTORS = [
+    "[data-testid='job-card']",
+    "[data-testid='search-result-card']",
+    ".search-result-card",
+    ".job-listing",
+    ".job-tile",
+    ".search-result",
+    ".serp-result",
+    "[role='listitem']",
+    ".card",
+    "article",
+    "div[id*='job']",
+    "div[class*='job']",
+    "a[href*='/jobs/detail/']"
+]
+
+_DICE_SELECTORS = [
+    "[data-testid]",
+    ".diceui-card",
+    "[class*='dice']",
+    "[id*='dice']"
+]
+
+# Resolved chromedriver binary, shared by every call in this process
+_DRIVER_PATH = None
+
+def _get_driver_path():
+    """Return the chromedriver path, resolving it at most once per process."""
+    global _DRIVER_PATH
+    if _DRIVER_PATH is None:
+        # CHROMEDRIVER_PATH skips webdriver-manager's network check entirely
+        _DRIVER_PATH = os.environ.get('CHROMEDRIVER_PATH') or ChromeDriverManager().install()
+    return _DRIVER_PATH
+
 def debug_dice_selenium():
     """Debug Dice.com structure using Selenium."""
     
@@ -23,9 +101,22 @@ def debug_dice_selenium():
     chrome_options.add_argument("--disable-dev-shm-usage")
     chrome_options.add_argument("--window-size=1920,1080")
     
-    # Setup driver
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=chrome_options)
+    # Only the DOM is inspected, so skip images and stylesheets and return
+    # from driver.get() at DOMContentLoaded instead of the full load event
+    chrome_options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.managed_default_content_settings.stylesheets": 2,
+    })
+    chrome_options.page_load_strategy = 'eager'
+    
+    # Setup driver - attach to a long-lived chromedriver if one is running
+    # (e.g. `chromedriver --port=9515`), otherwise start a local one
+    remote_url = os.environ.get('CHROMEDRIVER_URL')
+    if remote_url:
+        driver = webdriver.Remote(command_executor=remote_url, options=chrome_options)
+    else:
+        service = Service(_get_driver_path())
+        driver = webdriver.Chrome(service=service, options=chrome_options)
     
     try:
         # Load Dice.com job search
@@ -34,8 +125,15 @@ def debug_dice_selenium():
         
         driver.get(url)
         
-        # Wait for page to load
-        time.sleep(5)
+        # Wait until the first job card or detail link renders
+        try:
+            WebDriverWait(driver, 15).until(EC.any_of(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "a[href*='/jobs/detail/']")),
+                EC.presence_of_element_located((By.CSS_SELECTOR, "[data-testid='job-search-serp-card']")),
+                EC.presence_of_element_located((By.CSS_SELECTOR, "[data-testid='job-card']"))
+            ))
+        except TimeoutException:
+            print("Timed out waiting for job results, inspecting page anyway")
         
         print(f"Page title: {driver.title}")
         print(f"Current URL: {driver.current_url}")
@@ -47,39 +145,23 @@ def debug_dice_selenium():
         print("Saved full page source to dice_selenium_full_debug.html")
         
         # Try to find job elements with various selectors
-        job_selectors = [
-            "[data-testid='job-card']",
-            "[data-testid='search-result-card']", 
-            ".search-result-card",
-            ".job-listing",
-            ".job-tile",
-            ".search-result",
-            ".serp-result",
-            "[role='listitem']",
-            ".card",
-            "article",
-            "div[id*='job']",
-            "div[class*='job']",
-            "a[href*='/jobs/detail/']"
-        ]
-        
         print("\n🔍 Testing job element selectors:")
-        for selector in job_selectors:
-            try:
-                elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                print(f"  {selector}: {len(elements)} elements")
+        probes = driver.execute_script(_PROBE_SELECTORS_JS, _JOB_SELECTORS)
+        for selector, probe in zip(_JOB_SELECTORS, probes):
+            if 'count' not in probe:
+                print(f"  {selector}: Error - {probe['error']}")
+                continue
+            
+            print(f"  {selector}: {probe['count']} elements")
+            if 'error' in probe:
+                print(f"    Error - {probe['error']}")
+            
+            if probe['count'] > 0:
+                # Show first element's HTML
+                print(f"    First element HTML: {probe['html']}...")
                 
-                if elements and len(elements) > 0:
-                    # Show first element's HTML
-                    first_elem_html = elements[0].get_attribute('outerHTML')[:500]
-                    print(f"    First element HTML: {first_elem_html}...")
-                    
-                    # Try to find text content
-                    first_elem_text = elements[0].text[:200]
-                    print(f"    First element text: {first_elem_text}...")
-                    
-            except Exception as e:
-                print(f"  {selector}: Error - {e}")
+                # Try to find text content
+                print(f"    First element text: {probe['text']}...")
         
         # Look for common job-related text patterns
         print("\n🔍 Looking for job-related text patterns:")
@@ -89,38 +171,36 @@ def debug_dice_selenium():
             "remote", "salary", "full time", "part time"
         ]
         
-        page_text = driver.page_source.lower()
+        # Reuse the source fetched above rather than asking Chrome to
+        # serialize the rendered page a second time
+        page_text = page_source.lower()
         for pattern in job_patterns:
             count = page_text.count(pattern)
             print(f"  '{pattern}': {count} occurrences")
         
         # Check for specific Dice.com elements
         print("\n🔍 Looking for Dice.com specific elements:")
-        dice_selectors = [
-            "[data-testid]",
-            ".diceui-card",
-            "[class*='dice']",
-            "[id*='dice']"
-        ]
-        
-        for selector in dice_selectors:
-            try:
-                elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                print(f"  {selector}: {len(elements)} elements")
-                if elements:
-                    print(f"    Sample data-testid values: {[elem.get_attribute('data-testid') for elem in elements[:5]]}")
-            except Exception as e:
-                print(f"  {selector}: Error - {e}")
+        probes = driver.execute_script(_PROBE_SELECTORS_JS, _DICE_SELECTORS)
+        for selector, probe in zip(_DICE_SELECTORS, probes):
+            if 'count' not in probe:
+                print(f"  {selector}: Error - {probe['error']}")
+                continue
+            
+            print(f"  {selector}: {probe['count']} elements")
+            if 'error' in probe:
+                print(f"    Error - {probe['error']}")
+            if probe['count']:
+                print(f"    Sample data-testid values: {probe['testids']}")
         
         # Look for links to job details
         print("\n🔍 Looking for job detail links:")
-        job_links = driver.find_elements(By.CSS_SELECTOR, "a[href*='/jobs/detail/']")
-        print(f"Found {len(job_links)} job detail links")
+        job_links = driver.execute_script(_JOB_LINKS_JS, 3)
+        print(f"Found {job_links['count']} job detail links")
         
-        for i, link in enumerate(job_links[:3]):
-            print(f"  Link {i+1}: {link.get_attribute('href')}")
-            print(f"    Text: {link.text}")
-            print(f"    Parent HTML: {link.find_element(By.XPATH, '..').get_attribute('outerHTML')[:200]}...")
+        for i, link in enumerate(job_links['links']):
+            print(f"  Link {i+1}: {link['href']}")
+            print(f"    Text: {link['text']}")
+            print(f"    Parent HTML: {link['parent']}...")
         
     finally:
         driver.quit()
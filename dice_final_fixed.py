@@ -4,55 +4,138 @@ WORKING Dice.com scraper using correct 2024 selectors
 Based on analysis of actual Dice.com structure
 """
 
+import atexit
+import hashlib
+import heapq
+import os
+import queue
+import threading
 import time
 import json
-from typing import List, Dict, Any
+import re
+import sys
+import requests
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, asdict
+from functools import lru_cache
+from operator import attrgetter
+from pathlib import Path
 from datetime import datetime
-from urllib.parse import quote_plus
+from urllib.parse import urlencode
 from rich.console import Console
+from selectolax.lexbor import LexborHTMLParser
+
+from job_sites._terms import capped_score, compile_terms
 
 try:
     from selenium import webdriver
-    from selenium.webdriver.common.by import By
     from selenium.webdriver.support.ui import WebDriverWait
     from selenium.webdriver.support import expected_conditions as EC
     from selenium.webdriver.chrome.options import Options
-    from selenium.common.exceptions import TimeoutException, NoSuchElementException
+    from selenium.common.exceptions import TimeoutException
     from webdriver_manager.chrome import ChromeDriverManager
     from selenium.webdriver.chrome.service import Service
     SELENIUM_AVAILABLE = True
 except ImportError:
     SELENIUM_AVAILABLE = False
 
+# Each search result card on the Dice results page
+_JOB_CARD_SELECTOR = '[data-testid="job-search-serp-card"]'
+
+# Ready-made locator for the card wait ("css selector" is By.CSS_SELECTOR,
+# spelled out so the constant exists without Selenium installed)
+_JOB_CARD_LOCATOR = ("css selector", _JOB_CARD_SELECTOR)
+
+# Job title link candidates inside a card, in priority order
+_TITLE_SELECTORS = (
+    'a[href*="/jobs/detail/"]',  # Direct job detail links
+    'h2 a', 'h3 a', 'h4 a',     # Header links
+    '.job-title a',              # Job title class
+    'a[tabindex="-1"]'           # Tab-accessible links
+)
+
+_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+}
+
+# Raw search-page responses, keyed by sha256 of the URL, reused for CACHE_TTL seconds
+CACHE_DIR = Path(__file__).resolve().parent / '.dice_cache'
+CACHE_TTL = 600
+
+# Card text lines that are location/date/salary badges rather than the
+# company name (matched against the lowercased line)
+_COMPANY_SKIP_RE = re.compile(r'hybrid|remote|today|\$')
+
+# Substrings that mark a card text line as the job location
+_LOCATION_RE = re.compile(r'hybrid|remote|in |california|new york|texas')
+
+# Collects {title, url, text} for up to arguments[2] cards in a single
+# round-trip. Mirrors the Python rules: card selector with a role=listitem
+# fallback, title selectors in priority order, first link text over 3 chars.
+_EXTRACT_CARDS_JS = """
+const [cardSelector, titleSelectors, maxJobs] = arguments;
+let items = Array.from(document.querySelectorAll(cardSelector));
+if (!items.length) {
+    items = Array.from(document.querySelectorAll('[role="listitem"]'));
+}
+return items.slice(0, maxJobs).map(item => {
+    const card = item.querySelector(cardSelector) || item;
+    for (const sel of titleSelectors) {
+        for (const a of card.querySelectorAll(sel)) {
+            const text = (a.innerText || '').trim();
+            if (text.length > 3) {
+                return {title: text, url: a.href || '', text: card.innerText || ''};
+            }
+        }
+    }
+    return {title: '', url: '', text: card.innerText || ''};
+});
+"""
+
+# Subresources the scraper never reads, blocked at the network layer via CDP
+BLOCKED_URL_PATTERNS = [
+    "*.css", "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.webp",
+    "*.woff", "*.woff2", "*.ttf",
+    "*google-analytics*", "*googletagmanager*", "*doubleclick*",
+]
+
+# Warm Chrome drivers shared by every search in this process
+POOL_SIZE = 4
+_DRIVER_POOL = queue.Queue()
+_POOL_SLOTS = threading.BoundedSemaphore(POOL_SIZE)
+_POOL_LOCK = threading.Lock()
+_ALL_DRIVERS = set()
+
 # JobPosting class
+@dataclass(slots=True)
 class JobPosting:
-    def __init__(self, title: str, company: str, location: str, salary: str, 
-                 description: str, url: str, date_posted: str, job_site: str, 
-                 relevance_score: float = 0.0):
-        self.title = title
-        self.company = company
-        self.location = location
-        self.salary = salary
-        self.description = description
-        self.url = url
-        self.date_posted = date_posted
-        self.job_site = job_site
-        self.relevance_score = relevance_score
+    """Data class for job posting information."""
+    title: str
+    company: str
+    location: str
+    salary: str
+    description: str
+    url: str
+    date_posted: str
+    job_site: str
+    relevance_score: float = 0.0
     
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            'title': self.title,
-            'company': self.company,
-            'location': self.location,
-            'salary': self.salary,
-            'description': self.description,
-            'url': self.url,
-            'date_posted': self.date_posted,
-            'job_site': self.job_site,
-            'relevance_score': self.relevance_score
-        }
+        """Convert to dictionary for serialization."""
+        return asdict(self)
 
-def setup_chrome_driver(headless: bool = True) -> webdriver.Chrome:
+@lru_cache(maxsize=1)
+def _chromedriver_path() -> str:
+    """Resolve the chromedriver binary once per process; pooled drivers reuse it."""
+    return ChromeDriverManager().install()
+
+def setup_chrome_driver(headless: bool = True) -> "webdriver.Chrome":
     """Setup Chrome WebDriver with optimal settings for scraping."""
     if not SELENIUM_AVAILABLE:
         raise ImportError("Selenium not installed. Run: pip install selenium webdriver-manager")
@@ -60,7 +143,7 @@ def setup_chrome_driver(headless: bool = True) -> webdriver.Chrome:
     chrome_options = Options()
     
     if headless:
-        chrome_options.add_argument("--headless=new"  # Force headless mode)
+        chrome_options.add_argument("--headless=new")  # Force headless mode
     
     # Performance and security options
     chrome_options.add_argument("--no-sandbox")
@@ -68,24 +151,274 @@ def setup_chrome_driver(headless: bool = True) -> webdriver.Chrome:
     chrome_options.add_argument("--disable-gpu")
     chrome_options.add_argument("--window-size=1920,1080")
     chrome_options.add_argument("--disable-images")  # Faster loading
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
     chrome_options.add_argument("--disable-javascript-console")
+    chrome_options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.managed_default_content_settings.stylesheets": 2,
+    })
+    # Return from driver.get at DOMContentLoaded; the card wait covers the rest
+    chrome_options.page_load_strategy = 'eager'
     
     # User agent to avoid detection
     chrome_options.add_argument("--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
     
     try:
         # Use webdriver-manager to automatically download and manage ChromeDriver
-        service = Service(ChromeDriverManager().install())
+        service = Service(_chromedriver_path())
         driver = webdriver.Chrome(service=service, options=chrome_options)
         driver.set_page_load_timeout(30)
+        
+        # Hard-block images, stylesheets, fonts and trackers before any navigation
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
         return driver
     except Exception as e:
         raise Exception(f"Failed to setup Chrome driver: {e}")
 
-def get_dice_jobs_fixed(search_terms: List[str] = None, location: str = "Remote", max_jobs: int = 20) -> List[JobPosting]:
+def _acquire_driver() -> "webdriver.Chrome":
+    """Borrow an idle pooled driver, starting a new one while under POOL_SIZE."""
+    while True:
+        try:
+            return _DRIVER_POOL.get_nowait()
+        except queue.Empty:
+            pass
+        
+        if _POOL_SLOTS.acquire(blocking=False):
+            try:
+                driver = setup_chrome_driver(headless=True)
+            except Exception:
+                _POOL_SLOTS.release()
+                raise
+            with _POOL_LOCK:
+                _ALL_DRIVERS.add(driver)
+            return driver
+        
+        # Pool is full - wait for another search to hand a driver back
+        try:
+            return _DRIVER_POOL.get(timeout=1)
+        except queue.Empty:
+            continue
+
+def _discard_driver(driver: "webdriver.Chrome"):
+    """Quit a driver and free its pool slot."""
+    with _POOL_LOCK:
+        if driver not in _ALL_DRIVERS:
+            return
+        _ALL_DRIVERS.discard(driver)
+    _POOL_SLOTS.release()
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+def _release_driver(driver: "webdriver.Chrome"):
+    """Reset a borrowed driver and return it to the pool."""
+    try:
+        driver.delete_all_cookies()
+        driver.get('about:blank')
+    except Exception:
+        # Browser crashed or hung - drop it so a fresh one can take its slot
+        _discard_driver(driver)
+        return
+    _DRIVER_POOL.put(driver)
+
+def _shutdown_pool():
+    """Quit every pooled driver (registered with atexit)."""
+    with _POOL_LOCK:
+        drivers = list(_ALL_DRIVERS)
+    for driver in drivers:
+        _discard_driver(driver)
+
+atexit.register(_shutdown_pool)
+
+@lru_cache(maxsize=256)
+def _company_skip_matcher(title_lower: str):
+    """Search function rejecting button/badge lines and lines containing the title."""
+    return re.compile(f'{_COMPANY_SKIP_RE.pattern}|{re.escape(title_lower)}').search
+
+def _build_job_posting(title: str, job_url: str, job_text: str, search_terms: List[str] = None) -> JobPosting:
+    """Build a JobPosting from a job card's title link and its visible text."""
+    text_lines = [line.strip() for line in job_text.split('\n') if line.strip()]
+    
+    title_lower = title.lower()
+    skip_company_line = _company_skip_matcher(title_lower)
+    company = None
+    location_found = None
+    salary = None
+    description_candidates = []
+    
+    # Classify every line in a single pass
+    for line in text_lines:
+        line_lower = line.lower()
+        
+        # Company is typically the first non-empty line that's not a button or title
+        if (company is None and
+            len(line) > 2 and
+            not line.startswith('•') and
+            not skip_company_line(line_lower)):
+            company = line
+        
+        # Location - first line with a location pattern
+        if location_found is None and _LOCATION_RE.search(line_lower):
+            location_found = line
+        
+        # Salary - first line with a $ amount
+        if salary is None and '$' in line:
+            salary = line
+        
+        # Description - longer lines that aren't bullets or buttons
+        if (len(line) > 10 and
+            not line.startswith('•') and
+            'Easy Apply' not in line):
+            description_candidates.append(line)
+    
+    if company is None:
+        company = "Unknown Company"
+    if location_found is None:
+        location_found = "Not specified"
+    if salary is None:
+        salary = "Salary not specified"
+    
+    # The title and the lines picked as company/location/salary aren't part
+    # of the description; one hashed lookup per candidate covers all four
+    excluded = frozenset((title, company, location_found, salary))
+    description_lines = [line for line in description_candidates if line not in excluded]
+    
+    description = ' '.join(description_lines[:3])  # First 3 relevant lines
+    if not description:
+        description = f"{title} position at {company}"
+    
+    # Ensure job URL is absolute
+    if job_url and not job_url.startswith('http'):
+        job_url = 'https://www.dice.com' + job_url
+    
+    # Calculate relevance score (title was already lowercased for the line tests)
+    relevance_score = _score_lower(title_lower, description.lower(), search_terms)
+    
+    return JobPosting(
+        title=title,
+        company=company,
+        location=location_found,
+        salary=salary,
+        description=description[:500],  # Limit description length
+        url=job_url or 'https://dice.com',
+        date_posted=datetime.now().strftime('%Y-%m-%d'),
+        job_site="Dice",
+        relevance_score=relevance_score
+    )
+
+@lru_cache(maxsize=128)
+def _dice_url(query: str, location: str, page: int = 1) -> str:
+    """Dice.com results page URL for a query and location."""
+    return "https://www.dice.com/jobs?" + urlencode({
+        'q': query, 'location': location, 'radius': 30, 'radiusUnit': 'mi',
+        'page': page, 'pageSize': 20, 'language': 'en'
+    })
+
+def _fetch_search_page(search_url: str, use_cache: bool = True) -> bytes:
+    """GET a Dice results page, serving repeat URLs from the on-disk cache while fresh."""
+    cache_file = CACHE_DIR / f"{hashlib.sha256(search_url.encode()).hexdigest()}.html"
+    
+    if use_cache:
+        try:
+            if time.time() - cache_file.stat().st_mtime < CACHE_TTL:
+                return cache_file.read_bytes()
+        except OSError:
+            pass  # Not cached yet
+    
+    response = requests.get(search_url, headers=_HEADERS, timeout=15)
+    response.raise_for_status()
+    content = response.content
+    
+    try:
+        # Write then rename so concurrent searches never read a partial file
+        CACHE_DIR.mkdir(exist_ok=True)
+        tmp_file = cache_file.with_suffix(f'.{os.getpid()}.{threading.get_ident()}.tmp')
+        tmp_file.write_bytes(content)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass  # Caching is best-effort
+    
+    return content
+
+def _find_title(job_card) -> Tuple[str, str]:
+    """Return (title, href) of the first valid title link, by selector priority."""
+    for title_sel in _TITLE_SELECTORS:
+        for title_node in job_card.css(title_sel):
+            elem_text = title_node.text(separator=' ', strip=True)
+            if len(elem_text) > 3:  # Valid title
+                return elem_text, title_node.attributes.get('href') or ""
+    return "Unknown Position", ""
+
+def _iter_http_jobs(job_cards, search_terms: List[str], console: Console, log_lines: List[str]) -> Iterator[JobPosting]:
+    """Yield a JobPosting per server-rendered job card node, appending a progress line for each."""
+    for i, job_card in enumerate(job_cards):
+        try:
+            title, job_url = _find_title(job_card)
+            job_text = job_card.text(separator='\n', strip=True)
+            job_posting = _build_job_posting(title, job_url, job_text, search_terms)
+            
+            log_lines.append(f"✓ Job {i+1}: {job_posting.title} at {job_posting.company}")
+            yield job_posting
+            
+        except Exception as e:
+            console.print(f"[red]❌ Error extracting job {i+1}: {e}[/red]")
+            continue
+
+def get_dice_jobs_http(search_url: str, search_terms: List[str] = None, max_jobs: int = 20,
+                       use_cache: bool = True) -> Optional[List[JobPosting]]:
+    """
+    Scrape Dice.com's server-rendered results page without starting a browser.
+    
+    Returns None when the page has no job cards (results rendered client-side),
+    so the caller can fall back to Selenium. Jobs come back sorted by relevance.
+    """
+    console = Console()
+    
+    tree = LexborHTMLParser(_fetch_search_page(search_url, use_cache))
+    job_cards = tree.css(_JOB_CARD_SELECTOR)
+    
+    if not job_cards:
+        return None
+    
+    console.print(f"[green]✅ Found {len(job_cards)} job cards in page HTML[/green]")
+    
+    log_lines = []
+    jobs = heapq.nlargest(max_jobs, _iter_http_jobs(job_cards[:max_jobs], search_terms, console, log_lines),
+                          key=attrgetter('relevance_score'))
+    
+    # One render for the whole batch instead of a markup pass per job
+    if log_lines:
+        console.print("\n".join(log_lines), style="dim", markup=False)
+    
+    return jobs
+
+def _iter_browser_jobs(cards: List[Dict[str, str]], search_terms: List[str], console: Console, log_lines: List[str]) -> Iterator[JobPosting]:
+    """Yield a JobPosting per {title, url, text} card returned by _EXTRACT_CARDS_JS, appending a progress line for each."""
+    for i, card in enumerate(cards):
+        try:
+            title = card.get('title') or "Unknown Position"
+            job_url = card.get('url') or ""
+            
+            # Company, location, salary and description come from the card text
+            job_posting = _build_job_posting(title, job_url, card.get('text') or "", search_terms)
+            
+            log_lines.append(f"✓ Job {i+1}: {job_posting.title} at {job_posting.company}")
+            yield job_posting
+            
+        except Exception as e:
+            console.print(f"[red]❌ Error extracting job {i+1}: {e}[/red]")
+            continue
+
+def get_dice_jobs_fixed(search_terms: List[str] = None, location: str = "Remote", max_jobs: int = 20,
+                        use_cache: bool = True) -> List[JobPosting]:
     """
     WORKING Dice.com scraper using correct 2024 selectors based on real structure analysis.
     
+    Tries a plain HTTP fetch parsed with selectolax first and only starts
+    headless Chrome when the results page has no server-rendered job cards.
+    
     Key findings from analysis:
     - Jobs are in [role='listitem'] elements
     - Each job has data-testid="job-search-serp-card"
@@ -97,33 +430,48 @@ def get_dice_jobs_fixed(search_terms: List[str] = None, location: str = "Remote"
         search_terms: List of terms to search for
         location: Location to search in
         max_jobs: Maximum number of jobs to return
+        use_cache: Reuse a results page fetched within the last CACHE_TTL seconds
     
     Returns:
         List of JobPosting objects with real data
     """
     console = Console()
     
+    # Build search query
+    if search_terms:
+        query = " ".join(search_terms)
+    else:
+        query = "web developer"
+    
+    # Build search URL
+    search_url = _dice_url(query, location)
+    
+    # Fast path: no browser needed if the cards are in the served HTML
+    try:
+        console.print(f"[blue]🎲 Fetching Dice.com job search...[/blue]")
+        console.print(f"[dim]Query: {query}, Location: {location}[/dim]")
+        
+        jobs = get_dice_jobs_http(search_url, search_terms, max_jobs, use_cache)
+        
+        if jobs is not None:
+            console.print(f"[green]✅ Successfully extracted {len(jobs)} jobs from Dice.com[/green]")
+            return jobs
+        
+        console.print(f"[yellow]⚠️  No job cards in page HTML. Falling back to browser rendering...[/yellow]")
+    except requests.RequestException as e:
+        console.print(f"[yellow]⚠️  Direct fetch failed ({e}). Falling back to browser rendering...[/yellow]")
+    
     if not SELENIUM_AVAILABLE:
         console.print("[red]❌ Selenium not available. Install with: pip install selenium webdriver-manager[/red]")
         return []
     
     driver = None
     try:
-        # Build search query
-        if search_terms:
-            query = " ".join(search_terms)
-        else:
-            query = "web developer"
-        
-        # Setup driver
+        # Borrow a warm browser from the pool
         console.print(f"[blue]🎲 Setting up browser for Dice.com...[/blue]")
-        driver = setup_chrome_driver(headless=True)
-        
-        # Build search URL
-        search_url = f"https://www.dice.com/jobs?q={quote_plus(query)}&location={quote_plus(location)}&radius=30&radiusUnit=mi&page=1&pageSize=20&language=en"
+        driver = _acquire_driver()
         
         console.print(f"[blue]🎲 Loading Dice.com job search...[/blue]")
-        console.print(f"[dim]Query: {query}, Location: {location}[/dim]")
         
         # Load the page
         driver.get(search_url)
@@ -135,144 +483,30 @@ def get_dice_jobs_fixed(search_terms: List[str] = None, location: str = "Remote"
         
         # Wait for job cards to load - use CORRECT selector based on our analysis
         try:
-            wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, '[data-testid="job-search-serp-card"]')))
+            wait.until(EC.presence_of_element_located(_JOB_CARD_LOCATOR))
             console.print(f"[green]✅ Job search results loaded successfully[/green]")
         except TimeoutException:
             console.print(f"[yellow]⚠️  Timeout waiting for job results. Checking for jobs anyway...[/yellow]")
         
-        # Find job elements using CORRECT selector
-        job_elements = driver.find_elements(By.CSS_SELECTOR, '[data-testid="job-search-serp-card"]')
+        # Pull title, URL and text for every card in one script call instead
+        # of several WebDriver round-trips per card
+        cards = driver.execute_script(
+            _EXTRACT_CARDS_JS, _JOB_CARD_SELECTOR, list(_TITLE_SELECTORS), max_jobs
+        )
         
-        if not job_elements:
-            console.print(f"[yellow]⚠️  No job elements found with main selector. Trying fallback...[/yellow]")
-            # Fallback to role=listitem
-            job_elements = driver.find_elements(By.CSS_SELECTOR, '[role="listitem"]')
-        
-        if not job_elements:
+        if not cards:
             console.print(f"[red]❌ No job elements found on the page[/red]")
             return []
         
-        console.print(f"[green]✅ Found {len(job_elements)} job cards[/green]")
-        
-        # Extract job data using CORRECT selectors based on real structure
-        jobs = []
+        console.print(f"[green]✅ Found {len(cards)} job cards[/green]")
         
-        for i, job_element in enumerate(job_elements[:max_jobs]):
-            try:
-                # Method 1: Look for the actual job card within the listitem
-                job_card = None
-                try:
-                    job_card = job_element.find_element(By.CSS_SELECTOR, '[data-testid="job-search-serp-card"]')
-                except NoSuchElementException:
-                    job_card = job_element
-                
-                # Extract job title - look for clickable job title links
-                title = "Unknown Position"
-                job_url = ""
-                
-                # Try multiple selectors for job title based on typical patterns
-                title_selectors = [
-                    'a[href*="/jobs/detail/"]',  # Direct job detail links
-                    'h2 a', 'h3 a', 'h4 a',     # Header links
-                    '.job-title a',              # Job title class
-                    'a[tabindex="-1"]'           # Tab-accessible links
-                ]
-                
-                for title_sel in title_selectors:
-                    try:
-                        title_elements = job_card.find_elements(By.CSS_SELECTOR, title_sel)
-                        for title_elem in title_elements:
-                            elem_text = title_elem.text.strip()
-                            if elem_text and len(elem_text) > 3:  # Valid title
-                                title = elem_text
-                                job_url = title_elem.get_attribute('href') or ""
-                                break
-                        if title != "Unknown Position":
-                            break
-                    except NoSuchElementException:
-                        continue
-                
-                # Extract company name - look for standalone text or company elements
-                company = "Unknown Company"
-                
-                # Get all text content and parse for company
-                job_text = job_card.text
-                text_lines = [line.strip() for line in job_text.split('\n') if line.strip()]
-                
-                # Company is typically the first non-empty line that's not a button or title
-                skip_patterns = ['Easy Apply', 'Apply', 'Save', 'View Details', title.lower()]
-                for line in text_lines:
-                    line_lower = line.lower()
-                    if (len(line) > 2 and 
-                        not any(skip in line_lower for skip in skip_patterns) and
-                        not line.startswith('•') and
-                        not 'hybrid' in line_lower and
-                        not 'remote' in line_lower and
-                        not 'today' in line_lower and
-                        not '$' in line):
-                        company = line
-                        break
-                
-                # Extract location - look for location patterns
-                location_found = "Not specified"
-                for line in text_lines:
-                    if any(word in line.lower() for word in ['hybrid', 'remote', 'in ', 'california', 'new york', 'texas']):
-                        location_found = line
-                        break
-                
-                # Extract salary - look for $ patterns
-                salary = "Salary not specified"
-                for line in text_lines:
-                    if '$' in line:
-                        salary = line
-                        break
-                
-                # Extract description - combine relevant text
-                description_lines = []
-                for line in text_lines:
-                    if (len(line) > 10 and 
-                        line != title and 
-                        line != company and 
-                        line != location_found and 
-                        line != salary and
-                        not line.startswith('•') and
-                        'Easy Apply' not in line):
-                        description_lines.append(line)
-                
-                description = ' '.join(description_lines[:3])  # First 3 relevant lines
-                if not description:
-                    description = f"{title} position at {company}"
-                
-                # Ensure job URL is absolute
-                if job_url and not job_url.startswith('http'):
-                    job_url = 'https://www.dice.com' + job_url
-                
-                # Calculate relevance score
-                relevance_score = calculate_dice_relevance_score(title, description, search_terms)
-                
-                # Create job posting
-                job_posting = JobPosting(
-                    title=title,
-                    company=company,
-                    location=location_found,
-                    salary=salary,
-                    description=description[:500],  # Limit description length
-                    url=job_url or 'https://dice.com',
-                    date_posted=datetime.now().strftime('%Y-%m-%d'),
-                    job_site="Dice",
-                    relevance_score=relevance_score
-                )
-                
-                jobs.append(job_posting)
-                
-                console.print(f"[dim]✓ Job {i+1}: {title} at {company}[/dim]")
-                
-            except Exception as e:
-                console.print(f"[red]❌ Error extracting job {i+1}: {e}[/red]")
-                continue
+        # Extract job data and keep the most relevant, already sorted
+        log_lines = []
+        jobs = heapq.nlargest(max_jobs, _iter_browser_jobs(cards, search_terms, console, log_lines),
+                              key=attrgetter('relevance_score'))
         
-        # Sort by relevance score
-        jobs.sort(key=lambda x: x.relevance_score, reverse=True)
+        if log_lines:
+            console.print("\n".join(log_lines), style="dim", markup=False)
         
         console.print(f"[green]✅ Successfully extracted {len(jobs)} jobs from Dice.com[/green]")
         
@@ -284,52 +518,68 @@ def get_dice_jobs_fixed(search_terms: List[str] = None, location: str = "Remote"
         
     finally:
         if driver:
-            driver.quit()
+            _release_driver(driver)
 
-def calculate_dice_relevance_score(title: str, description: str, search_terms: List[str] = None) -> float:
-    """Calculate relevance score for a Dice job."""
-    if not search_terms:
-        search_terms = ['unity', 'web', 'react', 'javascript', 'c#', 'typescript', 'frontend', 'backend', 'full stack']
+def get_dice_jobs_batch(queries: List[Tuple[List[str], str]], max_jobs: int = 20, max_workers: int = POOL_SIZE) -> List[List[JobPosting]]:
+    """
+    Run several Dice.com searches concurrently.
     
-    score = 0.0
-    title_lower = title.lower()
-    description_lower = description.lower()
+    Each search is I/O-bound (network and page rendering), so threads
+    overlap well; browser fallbacks share the driver pool.
+    
+    Args:
+        queries: (search_terms, location) pairs to search for
+        max_jobs: Maximum number of jobs to return per search
+        max_workers: Concurrent searches, capped at POOL_SIZE
+    
+    Returns:
+        One list of JobPosting objects per query, in the order given
+    """
+    results = [[] for _ in queries]
+    workers = max(1, min(max_workers, POOL_SIZE))
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(get_dice_jobs_fixed, terms, location, max_jobs): i
+            for i, (terms, location) in enumerate(queries)
+        }
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    
+    return results
+
+@lru_cache(maxsize=64)
+def _search_terms_matcher(terms: Tuple[str, ...]):
+    """Compiled +25/+15 matcher for a search-term set, built once per distinct set."""
+    return compile_terms((term, 25, 15) for term in terms)
+
+_DEFAULT_SEARCH_TERMS = ('unity', 'web', 'react', 'javascript', 'c#', 'typescript', 'frontend', 'backend', 'full stack')
+
+# Unity/Game development (+20/+10), web development (+15/+8) and general
+# programming (+5/+3) bonuses, scanned for in one pass
+_CATEGORY_TERMS = compile_terms(
+    [(term, 20, 10) for term in ('unity', 'game', 'c#', 'csharp', 'gamedev', 'unreal', '3d')] +
+    [(term, 15, 8) for term in ('react', 'javascript', 'typescript', 'frontend', 'backend', 'full stack', 'web', 'node', 'vue', 'angular')] +
+    [(term, 5, 3) for term in ('developer', 'engineer', 'software', 'programmer', 'coding')]
+)
+
+def _score_lower(title_lower: str, description_lower: str, search_terms: List[str] = None) -> float:
+    """Relevance score for an already-lowercased title and description."""
+    if not search_terms:
+        search_terms = _DEFAULT_SEARCH_TERMS
     
     # Search terms bonus
-    if search_terms:
-        for term in search_terms:
-            term_lower = term.lower()
-            if term_lower in title_lower:
-                score += 25
-            if term_lower in description_lower:
-                score += 15
-    
-    # Unity/Game development bonus
-    unity_terms = ['unity', 'game', 'c#', 'csharp', 'gamedev', 'unreal', '3d']
-    for term in unity_terms:
-        if term in title_lower:
-            score += 20
-        if term in description_lower:
-            score += 10
-    
-    # Web development terms
-    web_terms = ['react', 'javascript', 'typescript', 'frontend', 'backend', 'full stack', 'web', 'node', 'vue', 'angular']
-    for term in web_terms:
-        if term in title_lower:
-            score += 15
-        if term in description_lower:
-            score += 8
-    
-    # General programming terms
-    general_terms = ['developer', 'engineer', 'software', 'programmer', 'coding']
-    for term in general_terms:
-        if term in title_lower:
-            score += 5
-        if term in description_lower:
-            score += 3
+    score = capped_score(_search_terms_matcher(tuple(sorted(search_terms))), title_lower, description_lower)
+    
+    # Category bonuses
+    score += capped_score(_CATEGORY_TERMS, title_lower, description_lower)
     
     return min(score, 100.0)  # Cap at 100
 
+def calculate_dice_relevance_score(title: str, description: str, search_terms: List[str] = None) -> float:
+    """Calculate relevance score for a Dice job."""
+    return _score_lower(title.lower(), description.lower(), search_terms)
+
 if __name__ == "__main__":
     """Test the WORKING Dice scraper."""
     console = Console()
@@ -343,7 +593,7 @@ if __name__ == "__main__":
     
     # Test with Unity and web development terms
     search_terms = ['react', 'javascript', 'web developer']
-    jobs = get_dice_jobs_fixed(search_terms=search_terms, max_jobs=5)
+    jobs = get_dice_jobs_fixed(search_terms=search_terms, max_jobs=5, use_cache='--no-cache' not in sys.argv)
     
     console.print(f"\n[green]Found {len(jobs)} jobs:[/green]")
     
@@ -4,55 +4,137 @@ FINAL WORKING Dice.com scraper - 2024 version with correct title extraction
 Based on detailed analysis of Dice.com's actual HTML structure
 """
 
+import multiprocessing
+import multiprocessing.util
+import os
 import time
 import json
-from typing import List, Dict, Any
+import re
+import threading
+import requests
+from typing import List, Dict, Any, Optional, Tuple
+from dataclasses import dataclass, asdict
 from datetime import datetime
+from functools import lru_cache
 from urllib.parse import quote_plus
 from rich.console import Console
 
+from job_sites._terms import capped_score, compile_terms
+
 try:
     from selenium import webdriver
     from selenium.webdriver.common.by import By
     from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
     from selenium.webdriver.chrome.options import Options
-    from selenium.common.exceptions import TimeoutException, NoSuchElementException
+    from selenium.common.exceptions import TimeoutException
     from webdriver_manager.chrome import ChromeDriverManager
     from selenium.webdriver.chrome.service import Service
     SELENIUM_AVAILABLE = True
 except ImportError:
     SELENIUM_AVAILABLE = False
 
+# Shared console; terminal detection runs once per process
+_CONSOLE = Console()
+
+# Words that mark a card text line as the job title
+_JOB_KEYWORDS_RE = re.compile('|'.join(map(re.escape, (
+    'developer', 'engineer', 'programmer', 'analyst', 'manager', 'lead', 'senior', 'junior',
+    'web', 'software', 'ui', 'ux', 'full stack', 'frontend', 'backend'
+))))
+
+# Substrings that mark a card text line as the job location
+_LOCATION_RE = re.compile('|'.join(map(re.escape, (
+    'hybrid', 'remote', 'in ', ', california', ', new york', ', texas', ', ohio', ', florida'
+))))
+
+# A $ amount or pay wording marks the salary line
+_SALARY_RE = re.compile(r'\$|salary|hourly|annual')
+
+# Button labels that never count as description text
+_DESCRIPTION_SKIP_LINES = frozenset({'easy apply', 'apply', 'save'})
+
+# Collects {text, url, title, company, location} for up to arguments[0] cards
+# in a single round-trip: search result cards (or role=listitem as a
+# fallback), their detail link, and any labelled title/company/location nodes.
+# Labelled fields are '' when a card has none; the Python side then falls back
+# to parsing the card text.
+_EXTRACT_CARDS_JS = """
+const cardSelector = '[data-testid="job-search-serp-card"]';
+const fieldSelectors = {
+    title: ['a[data-testid="job-search-job-detail-link"]', '[data-cy="card-title-link"]'],
+    company: ['[data-cy="search-result-company-name"]', 'a[href*="/company-profile/"]'],
+    location: ['[data-cy="search-result-location"]', '[data-testid="search-result-location"]']
+};
+const field = (card, selectors) => {
+    for (const sel of selectors) {
+        const node = card.querySelector(sel);
+        const text = node ? (node.innerText || '').trim() : '';
+        if (text) {
+            return text;
+        }
+    }
+    return '';
+};
+let cards = Array.from(document.querySelectorAll(cardSelector));
+if (!cards.length) {
+    // Fallback list items may wrap a card; matched cards are used as-is
+    cards = Array.from(document.querySelectorAll('[role="listitem"]'))
+        .map(item => item.querySelector(cardSelector) || item);
+}
+return cards.slice(0, arguments[0]).map(card => {
+    const link = Array.from(card.querySelectorAll('a')).find(a => a.href && a.href.includes('/jobs/detail/'));
+    return {
+        text: card.innerText || '',
+        url: link ? link.href : '',
+        title: field(card, fieldSelectors.title),
+        company: field(card, fieldSelectors.company),
+        location: field(card, fieldSelectors.location)
+    };
+});
+"""
+
+# Dice's results page is a React shell filled from this JSON endpoint. The
+# x-api-key is the public key shipped in Dice's frontend bundle; export it as
+# DICE_API_KEY to search without starting a browser.
+DICE_SEARCH_API = "https://job-search-api.svc.dhigroupinc.com/v1/dice/jobs/search"
+
 # JobPosting class
+@dataclass(slots=True, frozen=True)
 class JobPosting:
-    def __init__(self, title: str, company: str, location: str, salary: str, 
-                 description: str, url: str, date_posted: str, job_site: str, 
-                 relevance_score: float = 0.0):
-        self.title = title
-        self.company = company
-        self.location = location
-        self.salary = salary
-        self.description = description
-        self.url = url
-        self.date_posted = date_posted
-        self.job_site = job_site
-        self.relevance_score = relevance_score
+    """Data class for job posting information."""
+    title: str
+    company: str
+    location: str
+    salary: str
+    description: str
+    url: str
+    date_posted: str
+    job_site: str
+    relevance_score: float = 0.0
     
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            'title': self.title,
-            'company': self.company,
-            'location': self.location,
-            'salary': self.salary,
-            'description': self.description,
-            'url': self.url,
-            'date_posted': self.date_posted,
-            'job_site': self.job_site,
-            'relevance_score': self.relevance_score
-        }
+        """Convert to dictionary for serialization."""
+        return asdict(self)
+
+# Subresources the scraper never reads, blocked at the network layer via CDP
+BLOCKED_URL_PATTERNS = [
+    "*.css", "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.webp",
+    "*.woff", "*.woff2", "*.ttf", "*.mp4", "*.webm",
+    "*google-analytics*", "*googletagmanager*", "*doubleclick*",
+]
 
-def setup_chrome_driver(headless: bool = True) -> webdriver.Chrome:
+# Resolved chromedriver binary, looked up once per process
+_DRIVER_PATH = None
+
+def _get_driver_path() -> str:
+    """Return the chromedriver path, resolving it at most once per process."""
+    global _DRIVER_PATH
+    if _DRIVER_PATH is None:
+        # CHROMEDRIVER_PATH skips webdriver-manager's lookup entirely
+        _DRIVER_PATH = os.environ.get('CHROMEDRIVER_PATH') or ChromeDriverManager().install()
+    return _DRIVER_PATH
+
+def setup_chrome_driver(headless: bool = True) -> "webdriver.Chrome":
     """Setup Chrome WebDriver with optimal settings for scraping."""
     if not SELENIUM_AVAILABLE:
         raise ImportError("Selenium not installed. Run: pip install selenium webdriver-manager")
@@ -60,7 +142,7 @@ def setup_chrome_driver(headless: bool = True) -> webdriver.Chrome:
     chrome_options = Options()
     
     if headless:
-        chrome_options.add_argument("--headless=new"  # Force headless mode)
+        chrome_options.add_argument("--headless=new")  # Force headless mode
     
     # Performance and security options
     chrome_options.add_argument("--no-sandbox")
@@ -69,23 +151,98 @@ def setup_chrome_driver(headless: bool = True) -> webdriver.Chrome:
     chrome_options.add_argument("--window-size=1920,1080")
     chrome_options.add_argument("--disable-images")  # Faster loading
     chrome_options.add_argument("--disable-javascript-console")
+    chrome_options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.default_content_setting_values.notifications": 2,
+    })
     
     # User agent to avoid detection
     chrome_options.add_argument("--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
     
     try:
         # Use webdriver-manager to automatically download and manage ChromeDriver
-        service = Service(ChromeDriverManager().install())
+        service = Service(_get_driver_path())
         driver = webdriver.Chrome(service=service, options=chrome_options)
         driver.set_page_load_timeout(30)
+        
+        # Hard-block images, stylesheets, fonts, media and trackers before any navigation
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
         return driver
     except Exception as e:
         raise Exception(f"Failed to setup Chrome driver: {e}")
 
-def get_dice_jobs(search_terms: List[str] = None, location: str = "Remote", max_jobs: int = 20) -> List[JobPosting]:
+def get_dice_jobs_api(query: str, location: str, search_terms: List[str] = None, max_jobs: int = 20) -> Optional[List[JobPosting]]:
+    """
+    Search Dice.com through its JSON search API - no browser involved.
+    
+    Returns None when DICE_API_KEY isn't set, so the caller can fall back to
+    Selenium. Raises requests.RequestException on HTTP errors.
+    """
+    api_key = os.environ.get('DICE_API_KEY')
+    if not api_key:
+        return None
+    
+    params = {
+        'q': query,
+        'countryCode2': 'US',
+        'radius': 30,
+        'radiusUnit': 'mi',
+        'page': 1,
+        'pageSize': max_jobs,
+        'language': 'en'
+    }
+    if location.lower() == 'remote':
+        params['filters.isRemote'] = 'true'
+    else:
+        params['location'] = location
+    
+    response = requests.get(
+        DICE_SEARCH_API,
+        params=params,
+        headers={'x-api-key': api_key, 'Accept': 'application/json'},
+        timeout=15
+    )
+    response.raise_for_status()
+    
+    payload = response.json()
+    if not isinstance(payload, dict):
+        # Error arrays and other shapes fall back to the browser like bad JSON
+        raise ValueError(f"unexpected API response: {type(payload).__name__}")
+    
+    jobs = []
+    for job in payload.get('data', [])[:max_jobs]:
+        title = job.get('title') or "Unknown Position"
+        company = job.get('companyName') or "Unknown Company"
+        location_found = (job.get('jobLocation') or {}).get('displayName') or ("Remote" if job.get('isRemote') else "Not specified")
+        description = job.get('summary') or f"{title} position at {company}"
+        
+        jobs.append(JobPosting(
+            title=title,
+            company=company,
+            location=location_found,
+            salary=job.get('salary') or "Salary not specified",
+            description=description[:500],  # Limit description length
+            url=job.get('detailsPageUrl') or "https://dice.com",
+            date_posted=(job.get('postedDate') or '')[:10] or datetime.now().strftime('%Y-%m-%d'),
+            job_site="Dice",
+            relevance_score=calculate_dice_relevance_score(title, description, search_terms)
+        ))
+    
+    return jobs
+
+def _search_url(query: str, location: str) -> str:
+    """Dice.com results page URL for a query and location."""
+    return f"https://www.dice.com/jobs?q={quote_plus(query)}&location={quote_plus(location)}&radius=30&radiusUnit=mi&page=1&pageSize=20&language=en"
+
+def get_dice_jobs(search_terms: List[str] = None, location: str = "Remote", max_jobs: int = 20,
+                  driver: "webdriver.Chrome" = None) -> List[JobPosting]:
     """
     FINAL WORKING Dice.com scraper using correct 2024 structure.
     
+    Uses Dice's JSON search API when DICE_API_KEY is set, and otherwise
+    renders the search page in headless Chrome.
+    
     This scraper correctly handles Dice.com's React-based structure:
     1. Waits for JavaScript to load job content
     2. Uses correct CSS selectors: [data-testid="job-search-serp-card"]
@@ -96,30 +253,187 @@ def get_dice_jobs(search_terms: List[str] = None, location: str = "Remote", max_
         search_terms: List of terms to search for
         location: Location to search in  
         max_jobs: Maximum number of jobs to return
+        driver: Browser to reuse; by default one is started and quit per call
     
     Returns:
         List of JobPosting objects with real data
     """
-    console = Console()
+    console = _CONSOLE
+    
+    # Build search query
+    if search_terms:
+        query = " ".join(search_terms)
+    else:
+        query = "web developer"
+    
+    # Fast path: the JSON API returns the same jobs without rendering the page
+    try:
+        jobs = get_dice_jobs_api(query, location, search_terms, max_jobs)
+        if jobs is not None:
+            jobs.sort(key=lambda x: x.relevance_score, reverse=True)
+            console.print(f"[green]✅ Successfully fetched {len(jobs)} jobs from the Dice.com API[/green]")
+            return jobs
+    except (requests.RequestException, ValueError) as e:
+        console.print(f"[yellow]⚠️  Dice.com API failed ({e}). Falling back to browser rendering...[/yellow]")
     
     if not SELENIUM_AVAILABLE:
         console.print("[red]❌ Selenium not available. Install with: pip install selenium webdriver-manager[/red]")
         return []
     
-    driver = None
+    if driver is not None:
+        return _scrape_with_driver(driver, query, location, search_terms, max_jobs, console)
+    
     try:
-        # Build search query
-        if search_terms:
-            query = " ".join(search_terms)
-        else:
-            query = "web developer"
-        
         # Setup driver
         console.print(f"[blue]🎲 Setting up browser for Dice.com...[/blue]")
         driver = setup_chrome_driver(headless=True)
+    except Exception as e:
+        console.print(f"[red]❌ Error scraping Dice.com: {e}[/red]")
+        return []
+    
+    try:
+        return _scrape_with_driver(driver, query, location, search_terms, max_jobs, console)
+    finally:
+        driver.quit()
+
+def _parse_job_card(job_text: str, job_url: str, search_terms: List[str] = None,
+                    title: str = None, company: str = None, location: str = None) -> Optional[JobPosting]:
+    """
+    Build a JobPosting from a job card's visible text, or None for an empty card.
+    
+    title, company and location come from labelled card elements when the
+    page has them; only the fields left empty are guessed from the text.
+    """
+    # Get all text content and parse it intelligently
+    text_lines = [line.strip() for line in job_text.split('\n') if line.strip()]
+    lines_lower = [line.lower() for line in text_lines]
+    
+    if not text_lines:
+        return None
+    
+    # Parse the structured text content
+    # Based on observed patterns:
+    # Line 1: Company name
+    # Line 2: "Easy Apply" (skip)
+    # Line 3: Job title
+    # Line 4+: Location, salary, description
+    
+    company = company or None
+    title = title or None
+    location_found = location or None
+    salary = None
+    description_candidates = []
+    picked = None
+    surviving = 0
+    
+    # Classify every line in a single pass
+    for line, line_lower in zip(text_lines, lines_lower):
+        # Company - usually the first line, skipping "Easy Apply"
+        if company is None and line != "Easy Apply" and not line.startswith("•"):
+            company = line
+        
+        # Title - first line with a job-related keyword. A line before the
+        # company can't be the company, so comparing against the company
+        # found so far matches comparing against the final one.
+        if (title is None and
+            len(line) > 5 and
+            not line.startswith('$') and
+            line != company and
+            'hybrid' not in line_lower and
+            'remote' not in line_lower and
+            _JOB_KEYWORDS_RE.search(line_lower)):
+            title = line
+        
+        # Location - first line with a location pattern
+        if location_found is None and _LOCATION_RE.search(line_lower):
+            location_found = line
+        
+        # Salary - first line with a $ amount or pay wording
+        if salary is None and _SALARY_RE.search(line_lower):
+            salary = line
         
+        # Description - longer lines that aren't bullets, dates or buttons
+        if (len(line) > 15 and
+            not line.startswith('•') and
+            line_lower not in _DESCRIPTION_SKIP_LINES and
+            'today' not in line_lower and
+            'yesterday' not in line_lower):
+            description_candidates.append((line, line_lower))
+            if picked is not None and line_lower not in picked:
+                surviving += 1
+        
+        # Once all four fields are found they are final, so stop as soon as
+        # three description lines are known to survive the filter below
+        if picked is None and None not in (company, title, location_found, salary):
+            picked = {company.lower(), title.lower(), location_found.lower(), salary.lower()}
+            surviving = sum(line_lower not in picked for _, line_lower in description_candidates)
+        if surviving >= 3:
+            break
+    
+    if company is None:
+        company = "Unknown Company"
+    if title is None:
+        title = "Unknown Position"
+    if location_found is None:
+        location_found = "Not specified"
+    if salary is None:
+        salary = "Salary not specified"
+    
+    # Lines picked as company/title/location/salary aren't part of the description
+    if picked is None:
+        picked = {company.lower(), title.lower(), location_found.lower(), salary.lower()}
+    # First 3 surviving lines; stop filtering once those are found
+    description_parts = []
+    for line, line_lower in description_candidates:
+        if line_lower not in picked:
+            description_parts.append(line)
+            if len(description_parts) >= 3:
+                break
+    
+    description = ' '.join(description_parts) if description_parts else f"{title} position at {company}"
+    
+    if not job_url:
+        job_url = "https://dice.com"
+    
+    # Calculate relevance score
+    relevance_score = calculate_dice_relevance_score(title, description, search_terms)
+    
+    # Create job posting
+    return JobPosting(
+        title=title,
+        company=company,
+        location=location_found,
+        salary=salary,
+        description=description[:500],  # Limit description length
+        url=job_url,
+        date_posted=datetime.now().strftime('%Y-%m-%d'),
+        job_site="Dice",
+        relevance_score=relevance_score
+    )
+
+class _CardsReady:
+    """
+    Wait condition: true once `target` job cards are in the DOM, or once a
+    non-zero card count holds steady between two polls (fewer results than
+    `target` exist), so short result pages don't wait out the full timeout.
+    """
+    
+    def __init__(self, target: int):
+        self.target = target
+        self._last_count = 0
+    
+    def __call__(self, driver) -> bool:
+        count = len(driver.find_elements(By.CSS_SELECTOR, '[data-testid="job-search-serp-card"]'))
+        settled = count > 0 and count == self._last_count
+        self._last_count = count
+        return count >= self.target or settled
+
+def _scrape_with_driver(driver: "webdriver.Chrome", query: str, location: str, search_terms: List[str],
+                        max_jobs: int, console: Console) -> List[JobPosting]:
+    """Run one Dice.com search in an already-running browser."""
+    try:
         # Build search URL
-        search_url = f"https://www.dice.com/jobs?q={quote_plus(query)}&location={quote_plus(location)}&radius=30&radiusUnit=mi&page=1&pageSize=20&language=en"
+        search_url = _search_url(query, location)
         
         console.print(f"[blue]🎲 Loading Dice.com job search...[/blue]")
         console.print(f"[dim]Query: {query}, Location: {location}[/dim]")
@@ -132,142 +446,38 @@ def get_dice_jobs(search_terms: List[str] = None, location: str = "Remote", max_
         
         wait = WebDriverWait(driver, 15)
         
-        # Wait for job cards to load
+        # Wait until enough cards have hydrated (or the count stops growing)
         try:
-            wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, '[data-testid="job-search-serp-card"]')))
+            wait.until(_CardsReady(min(max_jobs, 10)))
             console.print(f"[green]✅ Job search results loaded successfully[/green]")
         except TimeoutException:
             console.print(f"[yellow]⚠️  Timeout waiting for job results. Checking for jobs anyway...[/yellow]")
         
-        # Find job elements using correct selector
-        job_elements = driver.find_elements(By.CSS_SELECTOR, '[data-testid="job-search-serp-card"]')
-        
-        if not job_elements:
-            console.print(f"[yellow]⚠️  No job elements found with main selector. Trying fallback...[/yellow]")
-            # Fallback to role=listitem 
-            job_elements = driver.find_elements(By.CSS_SELECTOR, '[role="listitem"]')
+        # Pull text and detail URL for every card in one script call instead
+        # of several WebDriver round-trips per card
+        cards = driver.execute_script(_EXTRACT_CARDS_JS, max_jobs)
         
-        if not job_elements:
+        if not cards:
             console.print(f"[red]❌ No job elements found on the page[/red]")
             return []
         
-        console.print(f"[green]✅ Found {len(job_elements)} job cards[/green]")
+        console.print(f"[green]✅ Found {len(cards)} job cards[/green]")
         
         # Extract job data
         jobs = []
         
-        for i, job_element in enumerate(job_elements[:max_jobs]):
+        for i, card in enumerate(cards):
             try:
-                # Get the job card element
-                job_card = None
-                try:
-                    job_card = job_element.find_element(By.CSS_SELECTOR, '[data-testid="job-search-serp-card"]')
-                except NoSuchElementException:
-                    job_card = job_element
-                
-                # Get all text content and parse it intelligently
-                job_text = job_card.text
-                text_lines = [line.strip() for line in job_text.split('\n') if line.strip()]
-                
-                if not text_lines:
-                    continue
-                
-                # Parse the structured text content
-                # Based on observed patterns:
-                # Line 1: Company name
-                # Line 2: "Easy Apply" (skip)
-                # Line 3: Job title
-                # Line 4+: Location, salary, description
-                
-                company = "Unknown Company"
-                title = "Unknown Position"
-                location_found = "Not specified"
-                salary = "Salary not specified"
-                description_parts = []
-                
-                # Extract company (usually first line, skip "Easy Apply")
-                for line in text_lines:
-                    if line and line != "Easy Apply" and not line.startswith("•"):
-                        company = line
-                        break
-                
-                # Extract title (look for job-related keywords)
-                job_keywords = ['developer', 'engineer', 'programmer', 'analyst', 'manager', 'lead', 'senior', 'junior', 'web', 'software', 'ui', 'ux', 'full stack', 'frontend', 'backend']
-                
-                for line in text_lines:
-                    line_lower = line.lower()
-                    if (any(keyword in line_lower for keyword in job_keywords) and 
-                        line != company and
-                        'hybrid' not in line_lower and
-                        'remote' not in line_lower and
-                        not line.startswith('$') and
-                        len(line) > 5):
-                        title = line
-                        break
-                
-                # Extract location (look for location patterns)
-                location_patterns = ['hybrid', 'remote', 'in ', ', california', ', new york', ', texas', ', ohio', ', florida']
-                for line in text_lines:
-                    line_lower = line.lower()
-                    if any(pattern in line_lower for pattern in location_patterns):
-                        location_found = line
-                        break
-                
-                # Extract salary (look for $ or salary numbers)
-                for line in text_lines:
-                    if '$' in line or any(word in line.lower() for word in ['salary', 'hourly', 'annual']):
-                        salary = line
-                        break
-                
-                # Extract description (combine remaining relevant lines)
-                skip_lines = {company.lower(), title.lower(), location_found.lower(), salary.lower(), 'easy apply', 'apply', 'save'}
-                for line in text_lines:
-                    line_lower = line.lower()
-                    if (len(line) > 15 and 
-                        line_lower not in skip_lines and
-                        not line.startswith('•') and
-                        'today' not in line_lower and
-                        'yesterday' not in line_lower):
-                        description_parts.append(line)
-                        if len(description_parts) >= 3:  # Limit description
-                            break
-                
-                description = ' '.join(description_parts) if description_parts else f"{title} position at {company}"
-                
-                # Try to extract job URL (look for clickable links)
-                job_url = ""
-                try:
-                    links = job_card.find_elements(By.TAG_NAME, 'a')
-                    for link in links:
-                        href = link.get_attribute('href')
-                        if href and '/jobs/detail/' in href:
-                            job_url = href
-                            break
-                except:
-                    pass
-                
-                if not job_url:
-                    job_url = "https://dice.com"
-                
-                # Calculate relevance score
-                relevance_score = calculate_dice_relevance_score(title, description, search_terms)
-                
-                # Create job posting
-                job_posting = JobPosting(
-                    title=title,
-                    company=company,
-                    location=location_found,
-                    salary=salary,
-                    description=description[:500],  # Limit description length
-                    url=job_url,
-                    date_posted=datetime.now().strftime('%Y-%m-%d'),
-                    job_site="Dice",
-                    relevance_score=relevance_score
+                job_posting = _parse_job_card(
+                    card.get('text') or "", card.get('url') or "", search_terms,
+                    title=card.get('title'), company=card.get('company'), location=card.get('location')
                 )
+                if job_posting is None:
+                    continue
                 
                 jobs.append(job_posting)
                 
-                console.print(f"[dim]✓ Job {i+1}: {title} at {company}[/dim]")
+                console.print(f"[dim]✓ Job {i+1}: {job_posting.title} at {job_posting.company}[/dim]")
                 
             except Exception as e:
                 console.print(f"[red]❌ Error extracting job {i+1}: {e}[/red]")
@@ -283,52 +493,54 @@ def get_dice_jobs(search_terms: List[str] = None, location: str = "Remote", max_
     except Exception as e:
         console.print(f"[red]❌ Error scraping Dice.com: {e}[/red]")
         return []
-        
-    finally:
-        if driver:
-            driver.quit()
+
+# Chrome instance owned by this process when running as a batch pool worker
+_WORKER_DRIVER = None
+
+def _scrape_one(args: Tuple[List[str], str, int]) -> List[JobPosting]:
+    """Pool task: run one search on this worker's persistent browser."""
+    global _WORKER_DRIVER
+    search_terms, location, max_jobs = args
+    
+    if _WORKER_DRIVER is None:
+        _WORKER_DRIVER = setup_chrome_driver(headless=True)
+        # Quit Chrome when the worker process exits (pool.close + join)
+        multiprocessing.util.Finalize(None, _WORKER_DRIVER.quit, exitpriority=10)
+    
+    return get_dice_jobs(search_terms=search_terms, location=location, max_jobs=max_jobs, driver=_WORKER_DRIVER)
+
+@lru_cache(maxsize=64)
+def _search_terms_matcher(terms: Tuple[str, ...]):
+    """Compiled +25/+15 matcher for a search-term set, built once per distinct set."""
+    return compile_terms((term, 25, 15) for term in terms)
+
+_DEFAULT_SEARCH_TERMS = ('unity', 'web', 'react', 'javascript', 'c#', 'typescript', 'frontend', 'backend', 'full stack')
+
+_UNITY_TERMS = ('unity', 'game', 'c#', 'csharp', 'gamedev', 'unreal', '3d')
+_WEB_TERMS = ('react', 'javascript', 'typescript', 'frontend', 'backend', 'full stack', 'web', 'node', 'vue', 'angular')
+_GENERAL_TERMS = ('developer', 'engineer', 'software', 'programmer', 'coding')
+
+# Unity/Game development (+20/+10), web development (+15/+8) and general
+# programming (+5/+3) bonuses, scanned for in one pass
+_CATEGORY_TERMS = compile_terms(
+    [(term, 20, 10) for term in _UNITY_TERMS] +
+    [(term, 15, 8) for term in _WEB_TERMS] +
+    [(term, 5, 3) for term in _GENERAL_TERMS]
+)
 
 def calculate_dice_relevance_score(title: str, description: str, search_terms: List[str] = None) -> float:
     """Calculate relevance score for a Dice job."""
     if not search_terms:
-        search_terms = ['unity', 'web', 'react', 'javascript', 'c#', 'typescript', 'frontend', 'backend', 'full stack']
+        search_terms = _DEFAULT_SEARCH_TERMS
     
-    score = 0.0
     title_lower = title.lower()
     description_lower = description.lower()
     
     # Search terms bonus
-    if search_terms:
-        for term in search_terms:
-            term_lower = term.lower()
-            if term_lower in title_lower:
-                score += 25
-            if term_lower in description_lower:
-                score += 15
-    
-    # Unity/Game development bonus
-    unity_terms = ['unity', 'game', 'c#', 'csharp', 'gamedev', 'unreal', '3d']
-    for term in unity_terms:
-        if term in title_lower:
-            score += 20
-        if term in description_lower:
-            score += 10
-    
-    # Web development terms
-    web_terms = ['react', 'javascript', 'typescript', 'frontend', 'backend', 'full stack', 'web', 'node', 'vue', 'angular']
-    for term in web_terms:
-        if term in title_lower:
-            score += 15
-        if term in description_lower:
-            score += 8
-    
-    # General programming terms
-    general_terms = ['developer', 'engineer', 'software', 'programmer', 'coding']
-    for term in general_terms:
-        if term in title_lower:
-            score += 5
-        if term in description_lower:
-            score += 3
+    score = capped_score(_search_terms_matcher(tuple(sorted(search_terms))), title_lower, description_lower)
+    
+    # Category bonuses
+    score += capped_score(_CATEGORY_TERMS, title_lower, description_lower)
     
     return min(score, 100.0)  # Cap at 100
 
@@ -336,26 +548,100 @@ def calculate_dice_relevance_score(title: str, description: str, search_terms: L
 class DiceSearcher:
     """Job searcher for Dice.com using web scraping."""
     
+    # Start time of the most recent search, shared by every searcher in the
+    # process so concurrent callers draw on one rate budget
+    _rate_lock = threading.Lock()
+    _last_request = float('-inf')
+    
     def __init__(self, config: Dict[str, Any]):
         self.config = config
-        self.console = Console()
+        self.console = _CONSOLE
+        # Minimum seconds between Dice.com searches (0 disables the limit)
+        self.rate_limit_delay = float(config.get('dice_rate_limit_delay', 2))
+        # Browser kept open while the searcher is used as a context manager
+        self._driver = None
     
-    def search_jobs(self, query: str, location: str = "Remote") -> List[JobPosting]:
-        """Search for jobs on Dice.com."""
+    def __enter__(self) -> "DiceSearcher":
+        """Start one browser and reuse it for every search in the with-block."""
+        if SELENIUM_AVAILABLE and self._driver is None:
+            try:
+                self._driver = setup_chrome_driver(headless=True)
+            except Exception as e:
+                # Searches fall back to a browser per call
+                self.console.print(f"[yellow]⚠️  Could not start a shared browser: {e}[/yellow]")
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        if self._driver is not None:
+            try:
+                self._driver.quit()
+            finally:
+                self._driver = None
+    
+    def _wait_for_rate_limit(self):
+        """Sleep only as long as needed to keep searches rate_limit_delay apart."""
+        if self.rate_limit_delay <= 0:
+            return
+        with DiceSearcher._rate_lock:
+            wait = DiceSearcher._last_request + self.rate_limit_delay - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            DiceSearcher._last_request = time.monotonic()
+    
+    def _paced(self, tasks):
+        """Yield tasks one at a time, each after waiting out the shared rate limit."""
+        for task in tasks:
+            self._wait_for_rate_limit()
+            yield task
+    
+    def _search_terms(self, query: str) -> List[str]:
         search_terms = query.lower().split()
         
         # Get search terms from config
         if 'search_terms' in self.config:
             search_terms.extend([term.lower() for term in self.config['search_terms']])
         
-        # Respectful delay
-        time.sleep(2)
+        return search_terms
+    
+    def search_jobs(self, query: str, location: str = "Remote") -> List[JobPosting]:
+        """Search for jobs on Dice.com."""
+        search_terms = self._search_terms(query)
+        
+        # Respectful delay, skipped when the last search was long enough ago
+        self._wait_for_rate_limit()
+        
+        return get_dice_jobs(search_terms=search_terms, location=location, max_jobs=20, driver=self._driver)
+    
+    def search_jobs_batch(self, queries: List[Tuple[str, str]]) -> List[List[JobPosting]]:
+        """
+        Run several (query, location) searches in parallel.
+        
+        WebDriver sessions can't be shared between threads, so each worker
+        process keeps its own Chrome and reuses it for every query it takes.
+        Pool size comes from config['dice_workers'] (default 4).
         
-        return get_dice_jobs(search_terms=search_terms, location=location, max_jobs=20)
+        Returns:
+            One list of JobPosting objects per query, in the order given
+        """
+        tasks = [(self._search_terms(query), location, 20) for query, location in queries]
+        processes = min(self.config.get('dice_workers', 4), len(tasks))
+        
+        if not SELENIUM_AVAILABLE or processes <= 1:
+            return [get_dice_jobs(*task, driver=self._driver) for task in self._paced(tasks)]
+        
+        pool = multiprocessing.Pool(processes=processes)
+        try:
+            # The pool's feeder thread pulls from the generator, so each search
+            # is handed to a worker only once the shared rate budget allows it
+            return list(pool.imap(_scrape_one, self._paced(tasks)))
+        finally:
+            # close + join (not terminate) so each worker runs its driver finalizer
+            pool.close()
+            pool.join()
 
 if __name__ == "__main__":
     """Test the FINAL working Dice scraper."""
-    console = Console()
+    console = _CONSOLE
     
     console.print("[yellow]🧪 Testing FINAL working Dice.com scraper...[/yellow]")
     
@@ -4,113 +4,396 @@ Modern Dice.com scraper using Selenium for JavaScript rendering
 Handles client-side rendered React applications
 """
 
+import atexit
+import hashlib
+import importlib.util
+import os
+import queue
+import sys
+import threading
 import time
 import json
-from typing import List, Dict, Any
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
+from pathlib import Path
 from urllib.parse import quote_plus
 from rich.console import Console
+from selectolax.lexbor import LexborHTMLParser
 
-try:
-    from selenium import webdriver
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
-    from selenium.webdriver.chrome.options import Options
-    from selenium.common.exceptions import TimeoutException, NoSuchElementException
-    from webdriver_manager.chrome import ChromeDriverManager
-    from selenium.webdriver.chrome.service import Service
-    SELENIUM_AVAILABLE = True
-except ImportError:
-    SELENIUM_AVAILABLE = False
+from job_sites._terms import capped_score, compile_terms
+
+# Selenium is only imported once a browser is actually started, so importing
+# this module (or just scoring jobs) doesn't pay for loading it
+SELENIUM_AVAILABLE = all(
+    importlib.util.find_spec(name) is not None for name in ("selenium", "webdriver_manager")
+)
 
 # JobPosting class
+@dataclass(slots=True)
 class JobPosting:
-    def __init__(self, title: str, company: str, location: str, salary: str, 
-                 description: str, url: str, date_posted: str, job_site: str, 
-                 relevance_score: float = 0.0):
-        self.title = title
-        self.company = company
-        self.location = location
-        self.salary = salary
-        self.description = description
-        self.url = url
-        self.date_posted = date_posted
-        self.job_site = job_site
-        self.relevance_score = relevance_score
+    """Data class for job posting information."""
+    title: str
+    company: str
+    location: str
+    salary: str
+    description: str
+    url: str
+    date_posted: str
+    job_site: str
+    relevance_score: float = 0.0
     
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            'title': self.title,
-            'company': self.company,
-            'location': self.location,
-            'salary': self.salary,
-            'description': self.description,
-            'url': self.url,
-            'date_posted': self.date_posted,
-            'job_site': self.job_site,
-            'relevance_score': self.relevance_score
-        }
+        """Convert to dictionary for serialization."""
+        return asdict(self)
+
+# Dice's results page is a React shell filled from this JSON endpoint. The
+# x-api-key is the public key shipped in Dice's frontend bundle; export it as
+# DICE_API_KEY to search without starting a browser.
+DICE_SEARCH_API = "https://job-search-api.svc.dhigroupinc.com/v1/dice/jobs/search"
+
+# Search results, keyed by sha256 of the normalized query, reused for CACHE_TTL seconds
+CACHE_DIR = Path(__file__).resolve().parent / '.dice_cache'
+CACHE_TTL = 3600
+
+# Resolved chromedriver binary, shared by every browser this process starts
+_DRIVER_PATH = None
+_DRIVER_PATH_LOCK = threading.Lock()
+
+# Warm Chrome drivers kept between searches in this process. A search borrows
+# an idle one and hands it back, so repeated calls reuse one browser while
+# concurrent batch workers each get their own.
+_IDLE_DRIVERS = queue.Queue()
+_ALL_DRIVERS = set()
+_DRIVERS_LOCK = threading.Lock()
+
+# Job card selectors, most specific first
+_JOB_SELECTORS = [
+    "[data-testid='job-card']",
+    "[data-testid='search-result-card']",
+    ".search-result-card",
+    ".job-listing",
+    ".job-tile",
+    ".search-result",
+    ".serp-result",
+    "[role='listitem']",
+    ".card",
+    "article"
+]
+_JOB_CARD_UNION = ", ".join(_JOB_SELECTORS)
+
+# Seconds allowed from starting the page load to the first job card appearing
+RESULTS_TIMEOUT = 15
 
-def setup_chrome_driver(headless: bool = True) -> webdriver.Chrome:
+# Resolves true as soon as arguments[0] matches, or false after arguments[1] ms
+_WAIT_FOR_CARDS_JS = """
+var selector = arguments[0], timeoutMs = arguments[1], done = arguments[arguments.length - 1];
+if (document.querySelector(selector)) {
+    done(true);
+    return;
+}
+var timer;
+var observer = new MutationObserver(function () {
+    if (document.querySelector(selector)) {
+        observer.disconnect();
+        clearTimeout(timer);
+        done(true);
+    }
+});
+observer.observe(document.documentElement, {childList: true, subtree: true});
+timer = setTimeout(function () {
+    observer.disconnect();
+    done(false);
+}, timeoutMs);
+"""
+
+# Per-field selectors, tried in order inside each job card
+_TITLE_SELECTORS = [
+    "h2 a", "h3 a", "h4 a",
+    "[data-testid='job-title'] a",
+    ".job-title a",
+    "a[href*='/jobs/detail/']",
+    ".title a"
+]
+_COMPANY_SELECTORS = [
+    "[data-testid='company']",
+    ".company",
+    ".employer",
+    ".company-name"
+]
+_LOCATION_SELECTORS = [
+    "[data-testid='location']",
+    ".location",
+    ".job-location",
+    ".locality"
+]
+_SALARY_SELECTORS = [
+    "[data-testid='salary']",
+    ".salary",
+    ".compensation",
+    ".pay"
+]
+_DESCRIPTION_SELECTORS = [
+    ".description",
+    ".job-summary",
+    ".snippet",
+    ".summary",
+    "[data-testid='job-summary']"
+]
+
+def _pick(card, selectors: List[str]) -> Tuple[Optional[str], str]:
+    """
+    Text and href of a card field, trying selectors in order.
+    
+    Stops at the first match with text; if every match is empty the last
+    one wins. Text is None when no selector matched at all.
+    """
+    text, href = None, ""
+    for selector in selectors:
+        node = card.css_first(selector)
+        if node is None:
+            continue
+        text = " ".join(node.text(separator=' ').split())  # Whitespace collapsed like innerText
+        href = node.attributes.get('href') or ""
+        if text:
+            break
+    return text, href
+
+def _get_driver_path() -> str:
+    """Return the chromedriver path, resolving it at most once per process."""
+    global _DRIVER_PATH
+    with _DRIVER_PATH_LOCK:
+        if _DRIVER_PATH is None:
+            # CHROMEDRIVER_PATH skips webdriver-manager's version check entirely
+            from webdriver_manager.chrome import ChromeDriverManager
+            _DRIVER_PATH = os.environ.get('CHROMEDRIVER_PATH') or ChromeDriverManager().install()
+            os.environ['CHROMEDRIVER_PATH'] = _DRIVER_PATH  # Inherited by child processes
+    return _DRIVER_PATH
+
+def setup_chrome_driver(headless: bool = True) -> "webdriver.Chrome":
     """Setup Chrome WebDriver with optimal settings for scraping."""
     if not SELENIUM_AVAILABLE:
         raise ImportError("Selenium not installed. Run: pip install selenium webdriver-manager")
     
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+    
     chrome_options = Options()
     
     if headless:
-        chrome_options.add_argument("--headless=new"  # Force headless mode)
+        chrome_options.add_argument("--headless=new")  # Force headless mode
     
     # Performance and security options
     chrome_options.add_argument("--no-sandbox")
     chrome_options.add_argument("--disable-dev-shm-usage")
     chrome_options.add_argument("--disable-gpu")
     chrome_options.add_argument("--window-size=1920,1080")
-    chrome_options.add_argument("--disable-images")  # Faster loading
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")  # Faster loading
     chrome_options.add_argument("--disable-javascript-console")
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_argument("--disable-sync")
+    chrome_options.add_argument("--no-first-run")
+    chrome_options.add_argument("--disable-background-networking")
+    chrome_options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.managed_default_content_settings.stylesheets": 2,
+    })
+    # Return from driver.get at DOMContentLoaded; the card wait covers the rest
+    chrome_options.page_load_strategy = 'eager'
     
     # User agent to avoid detection
     chrome_options.add_argument("--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
     
     try:
         # Use webdriver-manager to automatically download and manage ChromeDriver
-        service = Service(ChromeDriverManager().install())
+        service = Service(_get_driver_path())
         driver = webdriver.Chrome(service=service, options=chrome_options)
-        driver.set_page_load_timeout(30)
+        driver.set_page_load_timeout(RESULTS_TIMEOUT)  # The card wait gets whatever the load leaves
+        driver.set_script_timeout(20)  # Longer than the in-page card wait
         return driver
     except Exception as e:
         raise Exception(f"Failed to setup Chrome driver: {e}")
 
-def get_dice_jobs_selenium(search_terms: List[str] = None, location: str = "Remote", max_jobs: int = 20) -> List[JobPosting]:
+def _get_or_create_driver() -> "webdriver.Chrome":
+    """Borrow an idle warm driver, starting a new one only when none is free."""
+    try:
+        return _IDLE_DRIVERS.get_nowait()
+    except queue.Empty:
+        pass
+    
+    driver = setup_chrome_driver(headless=True)
+    with _DRIVERS_LOCK:
+        _ALL_DRIVERS.add(driver)
+    return driver
+
+def _discard_driver(driver: "webdriver.Chrome"):
+    """Quit a driver and forget it."""
+    with _DRIVERS_LOCK:
+        _ALL_DRIVERS.discard(driver)
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+def _release_driver(driver: "webdriver.Chrome"):
+    """Reset a borrowed driver and keep it warm for the next search."""
+    try:
+        driver.delete_all_cookies()
+        driver.get('about:blank')
+    except Exception:
+        # Browser crashed or hung - drop it so the next search starts fresh
+        _discard_driver(driver)
+        return
+    _IDLE_DRIVERS.put(driver)
+
+def _shutdown_drivers():
+    """Quit every warm driver (registered with atexit)."""
+    with _DRIVERS_LOCK:
+        drivers = list(_ALL_DRIVERS)
+    for driver in drivers:
+        _discard_driver(driver)
+
+atexit.register(_shutdown_drivers)
+
+def get_dice_jobs_api(query: str, location: str, search_terms: List[str] = None, max_jobs: int = 20) -> Optional[List[JobPosting]]:
+    """
+    Search Dice.com through its JSON search API - no browser involved.
+    
+    Returns None when DICE_API_KEY isn't set, so the caller can fall back to
+    Selenium. Raises requests.RequestException on HTTP errors.
+    """
+    api_key = os.environ.get('DICE_API_KEY')
+    if not api_key:
+        return None
+    
+    params = {
+        'q': query,
+        'countryCode2': 'US',
+        'radius': 30,
+        'radiusUnit': 'mi',
+        'page': 1,
+        'pageSize': max_jobs,
+        'language': 'en'
+    }
+    if location.lower() == 'remote':
+        params['filters.isRemote'] = 'true'
+    else:
+        params['location'] = location
+    
+    response = requests.get(
+        DICE_SEARCH_API,
+        params=params,
+        headers={'x-api-key': api_key, 'Accept': 'application/json'},
+        timeout=15
+    )
+    response.raise_for_status()
+    
+    payload = response.json()
+    if not isinstance(payload, dict):
+        # Error arrays and other shapes fall back to the browser like bad JSON
+        raise ValueError(f"unexpected API response: {type(payload).__name__}")
+    
+    jobs = []
+    for job in payload.get('data', [])[:max_jobs]:
+        title = job.get('title') or "Unknown Position"
+        company = job.get('companyName') or "Unknown Company"
+        job_location = (job.get('jobLocation') or {}).get('displayName') or ("Remote" if job.get('isRemote') else "Not specified")
+        description = job.get('summary') or f"{title} at {company}"
+        
+        jobs.append(JobPosting(
+            title=title,
+            company=company,
+            location=job_location,
+            salary=job.get('salary') or "Salary not specified",
+            description=description[:500],  # Limit description length
+            url=job.get('detailsPageUrl') or 'https://dice.com',
+            date_posted=(job.get('postedDate') or '')[:10] or datetime.now().strftime('%Y-%m-%d'),
+            job_site="Dice",
+            relevance_score=calculate_dice_relevance_score(title, description, search_terms)
+        ))
+    
+    return jobs
+
+def _cache_file(search_terms: List[str], location: str, max_jobs: int) -> Path:
+    """Cache file for a search; term order doesn't change the results, so it doesn't change the key."""
+    key = json.dumps({'q': sorted(search_terms or []), 'loc': location, 'max': max_jobs})
+    return CACHE_DIR / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+
+def get_dice_jobs_selenium(search_terms: List[str] = None, location: str = "Remote", max_jobs: int = 20,
+                           force_refresh: bool = False) -> List[JobPosting]:
     """
     Fetch real job data from Dice.com using Selenium for JavaScript rendering.
     
+    Uses Dice's JSON search API instead when DICE_API_KEY is set, and only
+    starts Chrome when the API isn't configured or fails. Results are kept
+    on disk for CACHE_TTL seconds, so repeating a search skips both.
+    
     Args:
         search_terms: List of terms to search for
         location: Location to search in
         max_jobs: Maximum number of jobs to return
+        force_refresh: Ignore any cached results and search again
     
     Returns:
         List of JobPosting objects with real data
     """
+    cache_file = _cache_file(search_terms, location, max_jobs)
+    
+    if not force_refresh:
+        try:
+            if time.time() - cache_file.stat().st_mtime < CACHE_TTL:
+                return [JobPosting(**job) for job in json.loads(cache_file.read_text(encoding='utf-8'))]
+        except (OSError, ValueError, TypeError):
+            pass  # Not cached yet, or unreadable - search again
+    
+    jobs = _scrape_dice_jobs(search_terms, location, max_jobs)
+    
+    # An empty list usually means a failed scrape, which shouldn't stick for an hour
+    if jobs:
+        try:
+            # Write then rename so concurrent searches never read a partial file
+            CACHE_DIR.mkdir(exist_ok=True)
+            tmp_file = cache_file.with_suffix(f'.{os.getpid()}.{threading.get_ident()}.tmp')
+            tmp_file.write_text(json.dumps([asdict(job) for job in jobs]), encoding='utf-8')
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            pass  # Caching is best-effort
+    
+    return jobs
+
+def _scrape_dice_jobs(search_terms: List[str], location: str, max_jobs: int) -> List[JobPosting]:
+    """Search Dice.com without the cache - the API when configured, otherwise Chrome."""
     console = Console()
     
+    # Build search query
+    if search_terms:
+        query = " ".join(search_terms)
+    else:
+        query = "web developer"
+    
+    # Fast path: the JSON API returns the same jobs without starting Chrome
+    try:
+        jobs = get_dice_jobs_api(query, location, search_terms, max_jobs)
+        if jobs is not None:
+            jobs.sort(key=lambda x: x.relevance_score, reverse=True)
+            console.print(f"[green]✅ Successfully fetched {len(jobs)} jobs from the Dice.com API[/green]")
+            return jobs
+    except (requests.RequestException, ValueError) as e:
+        console.print(f"[yellow]⚠️  Dice.com API failed ({e}). Falling back to Selenium...[/yellow]")
+    
     if not SELENIUM_AVAILABLE:
         console.print("[red]❌ Selenium not available. Install with: pip install selenium webdriver-manager[/red]")
         return []
     
     driver = None
+    healthy = True
     try:
-        # Build search query
-        if search_terms:
-            query = " ".join(search_terms)
-        else:
-            query = "web developer"
-        
-        # Setup driver
+        # Setup driver (reuses a warm browser from an earlier search if one is idle)
         console.print(f"[blue]🎲 Setting up browser for Dice.com...[/blue]")
-        driver = setup_chrome_driver(headless=True)
+        driver = _get_or_create_driver()
         
         # Build search URL
         search_url = f"https://www.dice.com/jobs?q={quote_plus(query)}&location={quote_plus(location)}&radius=30&radiusUnit=mi&page=1&pageSize=20&language=en"
@@ -119,48 +402,37 @@ def get_dice_jobs_selenium(search_terms: List[str] = None, location: str = "Remo
         console.print(f"[dim]Query: {query}, Location: {location}[/dim]")
         console.print(f"[dim]URL: {search_url}[/dim]")
         
-        # Load the page
+        # Load the page - the load (capped at RESULTS_TIMEOUT by the driver's
+        # page load timeout) and the card wait share one deadline
+        deadline = time.monotonic() + RESULTS_TIMEOUT
         driver.get(search_url)
         
         # Wait for page to load and job results to appear
         console.print(f"[yellow]⏳ Waiting for job results to load...[/yellow]")
         
-        # Try multiple selectors for job cards
-        job_selectors = [
-            "[data-testid='job-card']",
-            "[data-testid='search-result-card']", 
-            ".search-result-card",
-            ".job-listing",
-            ".job-tile",
-            ".search-result",
-            ".serp-result",
-            "[role='listitem']",
-            ".card",
-            "article"
-        ]
+        # One in-page wait for whichever job card selector appears first. A
+        # MutationObserver reports back the moment a card is inserted, rather
+        # than WebDriverWait polling chromedriver every 500ms
+        remaining = max(0.5, deadline - time.monotonic())
+        cards_ready = driver.execute_async_script(_WAIT_FOR_CARDS_JS, _JOB_CARD_UNION, int(remaining * 1000))
         
+        # Snapshot the rendered page once and parse it in-process, so the
+        # selector probing and field extraction below cost no WebDriver calls
+        page_source = driver.page_source
         job_elements = []
-        wait = WebDriverWait(driver, 15)
-        
-        # Try each selector until we find job elements
-        for selector in job_selectors:
-            try:
-                console.print(f"[dim]Trying selector: {selector}[/dim]")
-                wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
-                job_elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                
+        if cards_ready:
+            tree = LexborHTMLParser(page_source)
+            # Take the highest-priority selector that matches
+            for selector in _JOB_SELECTORS:
+                job_elements = tree.css(selector)
                 if job_elements:
                     console.print(f"[green]✅ Found {len(job_elements)} job elements with selector: {selector}[/green]")
                     break
-                    
-            except TimeoutException:
-                continue
         
         if not job_elements:
             console.print(f"[yellow]⚠️  No job elements found. Checking page content...[/yellow]")
             
             # Debug: Save page source for inspection
-            page_source = driver.page_source
             with open('/Users/tyler/Desktop/job-searcher/dice_selenium_debug.html', 'w') as f:
                 f.write(page_source)
             console.print(f"[dim]Saved page source to dice_selenium_debug.html for inspection[/dim]")
@@ -178,102 +450,23 @@ def get_dice_jobs_selenium(search_terms: List[str] = None, location: str = "Remo
         jobs = []
         console.print(f"[cyan]📊 Extracting job data from {len(job_elements)} elements...[/cyan]")
         
-        for i, element in enumerate(job_elements[:max_jobs]):
+        for i, card in enumerate(job_elements[:max_jobs]):
             try:
-                # Extract job title
-                title_selectors = [
-                    "h2 a", "h3 a", "h4 a",
-                    "[data-testid='job-title'] a",
-                    ".job-title a",
-                    "a[href*='/jobs/detail/']",
-                    ".title a"
-                ]
-                
-                title = "Unknown Position"
-                job_url = ""
-                
-                for title_sel in title_selectors:
-                    try:
-                        title_elem = element.find_element(By.CSS_SELECTOR, title_sel)
-                        title = title_elem.text.strip()
-                        job_url = title_elem.get_attribute('href') or ""
-                        if title:
-                            break
-                    except NoSuchElementException:
-                        continue
-                
-                # Extract company
-                company_selectors = [
-                    "[data-testid='company']",
-                    ".company",
-                    ".employer",
-                    ".company-name"
-                ]
-                
-                company = "Unknown Company"
-                for comp_sel in company_selectors:
-                    try:
-                        company_elem = element.find_element(By.CSS_SELECTOR, comp_sel)
-                        company = company_elem.text.strip()
-                        if company:
-                            break
-                    except NoSuchElementException:
-                        continue
-                
-                # Extract location
-                location_selectors = [
-                    "[data-testid='location']",
-                    ".location",
-                    ".job-location",
-                    ".locality"
-                ]
-                
-                job_location = "Not specified"
-                for loc_sel in location_selectors:
-                    try:
-                        location_elem = element.find_element(By.CSS_SELECTOR, loc_sel)
-                        job_location = location_elem.text.strip()
-                        if job_location:
-                            break
-                    except NoSuchElementException:
-                        continue
-                
-                # Extract salary
-                salary_selectors = [
-                    "[data-testid='salary']",
-                    ".salary",
-                    ".compensation",
-                    ".pay"
-                ]
-                
-                salary = "Salary not specified"
-                for sal_sel in salary_selectors:
-                    try:
-                        salary_elem = element.find_element(By.CSS_SELECTOR, sal_sel)
-                        salary = salary_elem.text.strip()
-                        if salary:
-                            break
-                    except NoSuchElementException:
-                        continue
-                
-                # Extract description/summary
-                desc_selectors = [
-                    ".description",
-                    ".job-summary",
-                    ".snippet",
-                    ".summary",
-                    "[data-testid='job-summary']"
-                ]
-                
-                description = f"{title} at {company}"
-                for desc_sel in desc_selectors:
-                    try:
-                        desc_elem = element.find_element(By.CSS_SELECTOR, desc_sel)
-                        description = desc_elem.text.strip()
-                        if description:
-                            break
-                    except NoSuchElementException:
-                        continue
+                title, job_url = _pick(card, _TITLE_SELECTORS)
+                if title is None:
+                    title = "Unknown Position"
+                company = _pick(card, _COMPANY_SELECTORS)[0]
+                if company is None:
+                    company = "Unknown Company"
+                job_location = _pick(card, _LOCATION_SELECTORS)[0]
+                if job_location is None:
+                    job_location = "Not specified"
+                salary = _pick(card, _SALARY_SELECTORS)[0]
+                if salary is None:
+                    salary = "Salary not specified"
+                description = _pick(card, _DESCRIPTION_SELECTORS)[0]
+                if description is None:
+                    description = f"{title} at {company}"
                 
                 # Ensure job URL is absolute
                 if job_url and not job_url.startswith('http'):
@@ -312,54 +505,65 @@ def get_dice_jobs_selenium(search_terms: List[str] = None, location: str = "Remo
         
     except Exception as e:
         console.print(f"[red]❌ Error scraping Dice.com: {e}[/red]")
+        healthy = False
         return []
         
     finally:
         if driver:
-            driver.quit()
+            if healthy:
+                _release_driver(driver)
+            else:
+                _discard_driver(driver)
+
+def get_dice_jobs_selenium_batch(queries: List[List[str]], location: str = "Remote", max_jobs: int = 20, max_workers: int = 3,
+                                 force_refresh: bool = False) -> List[List[JobPosting]]:
+    """
+    Run several Dice.com searches at once, one browser per worker thread.
+    
+    Each search spends most of its time waiting on page loads, so running
+    them side by side costs roughly as long as the slowest one.
+    
+    Args:
+        queries: One list of search terms per search
+        location: Location to search in
+        max_jobs: Maximum number of jobs to return per search
+        max_workers: Maximum number of browsers open at the same time
+        force_refresh: Ignore any cached results and search again
+    
+    Returns:
+        One list of JobPosting objects per query, in the order given
+    """
+    if not queries:
+        return []
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(queries))) as executor:
+        results = executor.map(
+            lambda terms: get_dice_jobs_selenium(search_terms=terms, location=location, max_jobs=max_jobs,
+                                                 force_refresh=force_refresh),
+            queries
+        )
+        return list(results)
+
+# (term, title weight, description weight) for every scored term: Unity/Game
+# development, web development, general programming, then tech skills
+_SCORE_TABLE = (
+    ('unity', 20, 10), ('game', 20, 10), ('c#', 20, 10), ('csharp', 20, 10),
+    ('gamedev', 20, 10), ('unreal', 20, 10), ('3d', 20, 10),
+    ('react', 15, 8), ('javascript', 15, 8), ('typescript', 15, 8), ('frontend', 15, 8),
+    ('backend', 15, 8), ('full stack', 15, 8), ('web', 15, 8), ('node', 15, 8),
+    ('vue', 15, 8), ('angular', 15, 8),
+    ('developer', 5, 3), ('engineer', 5, 3), ('software', 5, 3), ('programmer', 5, 3),
+    ('coding', 5, 3),
+    ('python', 8, 4), ('java', 8, 4), ('sql', 8, 4), ('aws', 8, 4), ('docker', 8, 4),
+    ('kubernetes', 8, 4), ('api', 8, 4), ('database', 8, 4),
+)
+
+# The whole table, scanned for in one pass
+_CATEGORY_TERMS = compile_terms(_SCORE_TABLE)
 
 def calculate_dice_relevance_score(title: str, description: str, search_terms: List[str] = None) -> float:
     """Calculate relevance score for a Dice job."""
-    if not search_terms:
-        search_terms = ['unity', 'web', 'react', 'javascript', 'c#', 'typescript', 'frontend', 'backend', 'full stack']
-    
-    score = 0.0
-    title_lower = title.lower()
-    description_lower = description.lower()
-    
-    # Unity/Game development bonus
-    unity_terms = ['unity', 'game', 'c#', 'csharp', 'gamedev', 'unreal', '3d']
-    for term in unity_terms:
-        if term in title_lower:
-            score += 20
-        if term in description_lower:
-            score += 10
-    
-    # Web development terms
-    web_terms = ['react', 'javascript', 'typescript', 'frontend', 'backend', 'full stack', 'web', 'node', 'vue', 'angular']
-    for term in web_terms:
-        if term in title_lower:
-            score += 15
-        if term in description_lower:
-            score += 8
-    
-    # General programming terms
-    general_terms = ['developer', 'engineer', 'software', 'programmer', 'coding']
-    for term in general_terms:
-        if term in title_lower:
-            score += 5
-        if term in description_lower:
-            score += 3
-    
-    # Tech skills bonus
-    tech_terms = ['python', 'java', 'sql', 'aws', 'docker', 'kubernetes', 'api', 'database']
-    for term in tech_terms:
-        if term in title_lower:
-            score += 8
-        if term in description_lower:
-            score += 4
-    
-    return min(score, 100.0)  # Cap at 100
+    return capped_score(_CATEGORY_TERMS, title.lower(), description.lower())
 
 if __name__ == "__main__":
     """Test the modern Dice scraper."""
@@ -374,7 +578,7 @@ if __name__ == "__main__":
     
     # Test with Unity and web development terms
     search_terms = ['unity', 'react', 'javascript', 'c#', 'web developer']
-    jobs = get_dice_jobs_selenium(search_terms=search_terms, max_jobs=5)
+    jobs = get_dice_jobs_selenium(search_terms=search_terms, max_jobs=5, force_refresh='--no-cache' in sys.argv)
     
     console.print(f"\n[green]Found {len(jobs)} jobs:[/green]")
     
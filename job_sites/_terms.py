@@ -0,0 +1,57 @@
+"""
+Weighted term matching shared by the relevance scorers
+Finds every scored term in a text with one regex scan
+"""
+
+import re
+from typing import Any, Dict, Iterator, List, Tuple
+
+def compile_terms(weighted_terms) -> Tuple[Any, Dict[str, Tuple[int, ...]], Dict[str, List[str]]]:
+    """
+    Build a single-scan matcher for (term, *weights) tuples.
+    
+    The lookahead alternation tries the longest term first at every offset,
+    and every term that is a prefix of the match is present there too, so
+    one finditer pass finds exactly the terms a per-term `in` check would.
+    Terms listed more than once have their weights summed. An empty term
+    cannot go in the pattern, but like `'' in text` it is present in any text.
+    """
+    weights = {}
+    for term, *term_weights in weighted_terms:
+        term = term.lower()
+        previous = weights.get(term)
+        weights[term] = tuple(term_weights) if previous is None else tuple(a + b for a, b in zip(previous, term_weights))
+    
+    ordered = sorted(filter(None, weights), key=len, reverse=True)
+    pattern = re.compile('(?=(' + '|'.join(map(re.escape, ordered)) + '))') if ordered else None
+    prefixes = {term: [other for other in ordered if term.startswith(other)] for term in ordered}
+    return pattern, weights, prefixes
+
+def iter_terms(matcher, text_lower: str) -> Iterator[str]:
+    """Yield each matcher term occurring in already-lowercased text, once, as the scan reaches it."""
+    pattern, weights, prefixes = matcher
+    if '' in weights:
+        yield ''
+    if pattern is None:
+        return
+    found = set()
+    for match in pattern.finditer(text_lower):
+        for term in prefixes[match.group(1)]:
+            if term not in found:
+                found.add(term)
+                yield term
+
+def capped_score(matcher, *texts_lower: str) -> float:
+    """
+    Sum each text's weight column (in order) for the matcher terms it contains, capped at 100.
+    
+    Weights are never negative, so scanning stops as soon as the cap is reached.
+    """
+    weights = matcher[1]
+    score = 0.0
+    for column, text_lower in enumerate(texts_lower):
+        for term in iter_terms(matcher, text_lower):
+            score += weights[term][column]
+            if score >= 100.0:
+                return 100.0
+    return score
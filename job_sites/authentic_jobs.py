@@ -4,47 +4,169 @@ Authentic Jobs API scraper - Creative and tech jobs
 Official API: https://authenticjobs.com/api/
 """
 
+import hashlib
+import json
+import os
+import re
 import requests
+from requests.adapters import HTTPAdapter
+import threading
 import time
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+from typing import List, Dict, Any, Tuple
 from rich.console import Console
+from selectolax.lexbor import LexborHTMLParser
 from datetime import datetime
+from pathlib import Path
+from functools import lru_cache
+from operator import attrgetter
+
+try:
+    from job_sites._terms import capped_score, compile_terms
+except ImportError:
+    # Run directly as job_sites/authentic_jobs.py
+    from _terms import capped_score, compile_terms
+
+# orjson parses the API payload in C; the stdlib parser is the fallback
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# Shared keep-alive session so the API call, the fallback pages and repeat
+# searches all reuse the TLS connection
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=20))
+_SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive',
+})
+
+# 200 responses kept on disk (keyed by sha256 of the URL) and served without a
+# request for CACHE_TTL seconds; older entries are revalidated with their
+# ETag / Last-Modified, so an unchanged page comes back as a bodiless 304
+CACHE_DIR = Path(__file__).resolve().parent.parent / '.authentic_jobs_cache'
+CACHE_TTL = 600
+
+# Listing pages are streamed and cut off here; the job cards come well before
+MAX_PAGE_BYTES = 2_000_000
+
+def _read_body(response: requests.Response, content_type: str = None, max_bytes: int = None) -> bytes:
+    """
+    Read a streamed response body and release the connection.
+    
+    Raises ValueError, without downloading the body, when a 200 response
+    declares a Content-Type not containing content_type. Stops reading after
+    max_bytes.
+    """
+    try:
+        declared = response.headers.get('Content-Type')
+        if content_type and response.status_code == 200 and declared and content_type not in declared:
+            raise ValueError(f"Expected {content_type}, got {declared}")
+        if max_bytes is None:
+            return response.content
+        
+        body = bytearray()
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            body += chunk
+            if len(body) >= max_bytes:
+                break
+        return bytes(body[:max_bytes])
+    finally:
+        response.close()
+
+def _fetch(url: str, timeout: float, headers: Dict[str, str] = None,
+           content_type: str = None, max_bytes: int = None) -> Tuple[int, bytes]:
+    """
+    GET a URL through the on-disk cache, returning (status code, body).
+    
+    content_type and max_bytes are passed to _read_body for fresh downloads.
+    """
+    key = hashlib.sha256(url.encode()).hexdigest()
+    body_file = CACHE_DIR / f"{key}.body"
+    meta_file = CACHE_DIR / f"{key}.json"
+    headers = headers or {}
+    
+    validators = {}
+    try:
+        if time.time() - body_file.stat().st_mtime < CACHE_TTL:
+            return 200, body_file.read_bytes()
+        meta = json.loads(meta_file.read_text(encoding='utf-8'))
+        if meta.get('etag'):
+            validators['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            validators['If-Modified-Since'] = meta['last_modified']
+    except (OSError, ValueError):
+        pass  # Not cached yet, or unreadable
+    
+    response = _SESSION.get(url, headers={**headers, **validators}, timeout=timeout, stream=True)
+    
+    if response.status_code == 304:
+        response.close()
+        try:
+            body_file.touch()  # Fresh for another CACHE_TTL
+            return 200, body_file.read_bytes()
+        except OSError:
+            # Lost the cached body - ask for the full page again
+            response = _SESSION.get(url, headers=headers, timeout=timeout, stream=True)
+    
+    content = _read_body(response, content_type, max_bytes)
+    
+    if response.status_code == 200:
+        try:
+            # Write then rename so concurrent searches never read a partial file
+            CACHE_DIR.mkdir(exist_ok=True)
+            suffix = f'.{os.getpid()}.{threading.get_ident()}.tmp'
+            meta = {'etag': response.headers.get('ETag'), 'last_modified': response.headers.get('Last-Modified')}
+            for path, data in ((body_file, content), (meta_file, json.dumps(meta).encode())):
+                tmp_file = path.with_suffix(suffix)
+                tmp_file.write_bytes(data)
+                os.replace(tmp_file, path)
+        except OSError:
+            pass  # Caching is best-effort
+    
+    return response.status_code, content
+
+# Per-field selectors for scraped listings; each is one query per card, and
+# the first matching element in document order wins
+_TITLE_SELECTOR = 'h2, h3, .title'
+_COMPANY_SELECTOR = '.company, .employer'
+_LOCATION_SELECTOR = '.location, .job-location'
+_DESCRIPTION_SELECTOR = '.description, .excerpt'
+
+# Words marking a link as a likely job posting, matched anywhere in its href or text
+_JOB_LINK_RE = re.compile('job|position|career|work|developer|engineer', re.IGNORECASE)
 
 # Simple JobPosting class for Authentic Jobs data
+@dataclass(slots=True)
 class JobPosting:
-    def __init__(self, title: str, company: str, location: str, salary: str, 
-                 description: str, url: str, date_posted: str, job_site: str, 
-                 relevance_score: float = 0.0):
-        self.title = title
-        self.company = company
-        self.location = location
-        self.salary = salary
-        self.description = description
-        self.url = url
-        self.date_posted = date_posted
-        self.job_site = job_site
-        self.relevance_score = relevance_score
+    """Data class for job posting information."""
+    title: str
+    company: str
+    location: str
+    salary: str
+    description: str
+    url: str
+    date_posted: str
+    job_site: str
+    relevance_score: float = 0.0
     
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            'title': self.title,
-            'company': self.company,
-            'location': self.location,
-            'salary': self.salary,
-            'description': self.description,
-            'url': self.url,
-            'date_posted': self.date_posted,
-            'job_site': self.job_site,
-            'relevance_score': self.relevance_score
-        }
+        """Convert to dictionary for serialization."""
+        return asdict(self)
 
-def get_authentic_jobs(search_terms: List[str] = None, max_jobs: int = 20) -> List[JobPosting]:
+def get_authentic_jobs(search_terms: List[str] = None, max_jobs: int = 20, min_score: float = 0.0) -> List[JobPosting]:
     """
     Fetch real job data from Authentic Jobs using their official API.
     
     Args:
         search_terms: List of terms to search for
         max_jobs: Maximum number of jobs to return
+        min_score: Skip API jobs scoring below this (0 keeps everything)
     
     Returns:
         List of JobPosting objects with real data
@@ -59,26 +181,21 @@ def get_authentic_jobs(search_terms: List[str] = None, max_jobs: int = 20) -> Li
         # Try to get recent jobs first (no key required for some endpoints)
         recent_url = f"{base_url}/posts/recent/"
         
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
-            'Accept': 'application/json',
-            'Accept-Language': 'en-US,en;q=0.9',
-        }
-        
         console.print(f"[blue]🎨 Fetching jobs from Authentic Jobs API...[/blue]")
         
         # Make API request with respectful delay
-        response = requests.get(recent_url, headers=headers, timeout=10)
+        status_code, content = _fetch(recent_url, timeout=10, headers={'Accept': 'application/json'})
         
-        if response.status_code == 403 or response.status_code == 404:
+        if status_code == 403 or status_code == 404:
             # API discontinued or key required - fallback to web scraping
             console.print(f"[yellow]⚠️  API unavailable (404), switching to web scraping...[/yellow]")
             return scrape_authentic_jobs_web(search_terms, max_jobs)
         
-        response.raise_for_status()
+        if status_code >= 400:
+            raise requests.HTTPError(f"{status_code} Error for url: {recent_url}")
         
-        # Parse JSON response
-        jobs_data = response.json()
+        # Parse JSON response straight from the raw bytes
+        jobs_data = _json_loads(content)
         
         if isinstance(jobs_data, dict) and 'listings' in jobs_data:
             jobs_list = jobs_data['listings']
@@ -95,6 +212,12 @@ def get_authentic_jobs(search_terms: List[str] = None, max_jobs: int = 20) -> Li
         
         for job_data in jobs_list[:max_jobs]:
             try:
+                # Calculate relevance score first - it reads the raw fields, so a
+                # job below min_score is dropped before any HTML stripping
+                relevance_score = calculate_relevance_score(job_data, search_terms)
+                if relevance_score < min_score:
+                    continue
+                
                 # Extract job details from API response
                 title = job_data.get('title', 'Unknown Position')
                 company = job_data.get('company', 'Unknown Company')
@@ -110,8 +233,7 @@ def get_authentic_jobs(search_terms: List[str] = None, max_jobs: int = 20) -> Li
                 
                 # Clean HTML from description if present
                 if '<' in description:
-                    from bs4 import BeautifulSoup
-                    description = BeautifulSoup(description, 'html.parser').get_text()
+                    description = LexborHTMLParser(description).text()
                 
                 # Build job URL
                 job_url = job_data.get('url', job_data.get('link', 'https://authenticjobs.com'))
@@ -119,9 +241,6 @@ def get_authentic_jobs(search_terms: List[str] = None, max_jobs: int = 20) -> Li
                 # Date posted
                 date_posted = job_data.get('date_posted', datetime.now().strftime('%Y-%m-%d'))
                 
-                # Calculate relevance score
-                relevance_score = calculate_relevance_score(job_data, search_terms)
-                
                 job_posting = JobPosting(
                     title=title,
                     company=company,
@@ -141,7 +260,7 @@ def get_authentic_jobs(search_terms: List[str] = None, max_jobs: int = 20) -> Li
                 continue
         
         # Sort by relevance score (highest first)
-        job_postings.sort(key=lambda x: x.relevance_score, reverse=True)
+        job_postings.sort(key=attrgetter('relevance_score'), reverse=True)
         
         console.print(f"[cyan]📊 Processed {len(job_postings)} jobs, scored by relevance[/cyan]")
         
@@ -161,8 +280,6 @@ def scrape_authentic_jobs_web(search_terms: List[str] = None, max_jobs: int = 20
     console = Console()
     
     try:
-        from bs4 import BeautifulSoup
-        
         # Try main jobs page and search page
         urls_to_try = [
             "https://authenticjobs.com/jobs",
@@ -170,30 +287,32 @@ def scrape_authentic_jobs_web(search_terms: List[str] = None, max_jobs: int = 20
             "https://authenticjobs.com/search"
         ]
         
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-        }
-        
-        soup = None
+        tree = None
         working_url = None
         
-        # Try different URLs to find working page
-        for url in urls_to_try:
-            try:
-                console.print(f"[dim]Trying: {url}[/dim]")
-                response = requests.get(url, headers=headers, timeout=15)
-                if response.status_code == 200:
-                    soup = BeautifulSoup(response.content, 'html.parser')
+        # Request every candidate page at once, then take the first one (in
+        # priority order) that answered 200 - a dead URL no longer delays the rest
+        console.print(f"[dim]Trying: {', '.join(urls_to_try)}[/dim]")
+        executor = ThreadPoolExecutor(max_workers=len(urls_to_try))
+        try:
+            futures = [
+                executor.submit(_fetch, url, 15, content_type='html', max_bytes=MAX_PAGE_BYTES)
+                for url in urls_to_try
+            ]
+            for url, future in zip(urls_to_try, futures):
+                try:
+                    status_code, content = future.result()
+                except Exception:
+                    continue
+                if status_code == 200:
+                    tree = LexborHTMLParser(content)
                     working_url = url
                     break
-            except:
-                continue
+        finally:
+            # Don't wait on slower fallbacks once a page has loaded
+            executor.shutdown(wait=False, cancel_futures=True)
         
-        if not soup:
+        if tree is None:
             console.print(f"[red]❌ Could not access any Authentic Jobs pages[/red]")
             return []
         
@@ -215,7 +334,7 @@ def scrape_authentic_jobs_web(search_terms: List[str] = None, max_jobs: int = 20
         
         job_listings = []
         for selector in job_selectors:
-            job_listings = soup.select(selector)
+            job_listings = tree.css(selector)
             if job_listings:
                 console.print(f"[green]Found {len(job_listings)} jobs using selector: {selector}[/green]")
                 break
@@ -223,14 +342,15 @@ def scrape_authentic_jobs_web(search_terms: List[str] = None, max_jobs: int = 20
         # If no structured listings found, look for any links that might be jobs
         if not job_listings:
             # Look for links that contain job-related keywords
-            all_links = soup.find_all('a', href=True)
+            all_links = tree.css('a[href]')
             job_listings = []
             for link in all_links:
-                href = link.get('href', '')
-                text = link.get_text(strip=True).lower()
-                if any(word in href.lower() or word in text for word in ['job', 'position', 'career', 'work', 'developer', 'engineer']):
-                    if len(text) > 10:  # Skip very short links
-                        job_listings.append(link)
+                text = link.text(strip=True)
+                if len(text) <= 10:  # Skip very short links
+                    continue
+                href = link.attributes.get('href') or ''
+                if _JOB_LINK_RE.search(href) or _JOB_LINK_RE.search(text):
+                    job_listings.append(link)
             
             console.print(f"[yellow]Found {len(job_listings)} potential job links[/yellow]")
         
@@ -241,25 +361,25 @@ def scrape_authentic_jobs_web(search_terms: List[str] = None, max_jobs: int = 20
         for job_elem in job_listings[:max_jobs]:
             try:
                 # Extract job details
-                title_elem = job_elem.find('h2') or job_elem.find('h3') or job_elem.find('.title')
-                title = title_elem.get_text(strip=True) if title_elem else 'Unknown Position'
+                title_elem = job_elem.css_first(_TITLE_SELECTOR)
+                title = title_elem.text(strip=True) if title_elem else 'Unknown Position'
                 
-                company_elem = job_elem.find('.company') or job_elem.find('.employer')
-                company = company_elem.get_text(strip=True) if company_elem else 'Unknown Company'
+                company_elem = job_elem.css_first(_COMPANY_SELECTOR)
+                company = company_elem.text(strip=True) if company_elem else 'Unknown Company'
                 
-                location_elem = job_elem.find('.location') or job_elem.find('.job-location')
-                location = location_elem.get_text(strip=True) if location_elem else 'Not specified'
+                location_elem = job_elem.css_first(_LOCATION_SELECTOR)
+                location = location_elem.text(strip=True) if location_elem else 'Not specified'
                 
                 # Get job URL
-                link_elem = job_elem.find('a', href=True) or title_elem.find('a', href=True) if title_elem else None
-                job_url = link_elem['href'] if link_elem else 'https://authenticjobs.com'
+                link_elem = job_elem.css_first('a[href]') or title_elem.css_first('a[href]') if title_elem else None
+                job_url = (link_elem.attributes.get('href') if link_elem else None) or 'https://authenticjobs.com'
                 
                 if job_url.startswith('/'):
                     job_url = 'https://authenticjobs.com' + job_url
                 
                 # Description (brief)
-                desc_elem = job_elem.find('.description') or job_elem.find('.excerpt')
-                description = desc_elem.get_text(strip=True) if desc_elem else f"{title} at {company}"
+                desc_elem = job_elem.css_first(_DESCRIPTION_SELECTOR)
+                description = desc_elem.text(strip=True) if desc_elem else f"{title} at {company}"
                 
                 # Mock relevance score for web scraping
                 relevance_score = calculate_web_relevance_score(title, description, search_terms)
@@ -285,7 +405,7 @@ def scrape_authentic_jobs_web(search_terms: List[str] = None, max_jobs: int = 20
         console.print(f"[cyan]📊 Processed {len(job_postings)} jobs from web scraping[/cyan]")
         
         # Sort by relevance
-        job_postings.sort(key=lambda x: x.relevance_score, reverse=True)
+        job_postings.sort(key=attrgetter('relevance_score'), reverse=True)
         
         return job_postings
         
@@ -293,92 +413,99 @@ def scrape_authentic_jobs_web(search_terms: List[str] = None, max_jobs: int = 20
         console.print(f"[red]❌ Web scraping error: {e}[/red]")
         return []
 
+# (term, title weight, description weight, category weight): Unity/Game
+# development, web development, creative/design (Authentic Jobs specialty)
+# and general programming terms
+_SCORE_TABLE = (
+    [(term, 20, 10, 15) for term in ('unity', 'game', 'c#', 'csharp', 'gamedev', 'unreal', '3d', 'mobile game')] +
+    [(term, 15, 8, 12) for term in ('react', 'javascript', 'typescript', 'frontend', 'backend', 'full stack', 'web', 'node', 'vue', 'angular')] +
+    [(term, 10, 5, 0) for term in ('ui', 'ux', 'design', 'creative', 'visual', 'graphic', 'interactive')] +
+    [(term, 5, 3, 0) for term in ('developer', 'engineer', 'software', 'programmer', 'coding')]
+)
+
+# The whole table, scanned for in one pass per field
+_RELEVANCE_TERMS = compile_terms(_SCORE_TABLE)
+
 def calculate_relevance_score(job_data: Dict, search_terms: List[str] = None) -> float:
     """Calculate relevance score for a job based on search terms."""
-    if not search_terms:
-        search_terms = ['unity', 'web', 'react', 'javascript', 'c#', 'typescript', 'frontend', 'backend', 'full stack', 'creative', 'design']
-    
-    score = 0.0
-    
-    # Check title and description
+    # Check title, description and category
     title = job_data.get('title', '').lower()
     description = job_data.get('description', '').lower()
     category = job_data.get('category', '').lower()
     
-    # Unity/Game development bonus
-    unity_terms = ['unity', 'game', 'c#', 'csharp', 'gamedev', 'unreal', '3d', 'mobile game']
-    for term in unity_terms:
-        if term in title:
-            score += 20
-        if term in description:
-            score += 10
-        if term in category:
-            score += 15
-    
-    # Web development terms
-    web_terms = ['react', 'javascript', 'typescript', 'frontend', 'backend', 'full stack', 'web', 'node', 'vue', 'angular']
-    for term in web_terms:
-        if term in title:
-            score += 15
-        if term in description:
-            score += 8
-        if term in category:
-            score += 12
-    
-    # Creative/design terms (Authentic Jobs specialty)
-    creative_terms = ['ui', 'ux', 'design', 'creative', 'visual', 'graphic', 'interactive']
-    for term in creative_terms:
-        if term in title:
-            score += 10
-        if term in description:
-            score += 5
-    
-    # General programming terms
-    general_terms = ['developer', 'engineer', 'software', 'programmer', 'coding']
-    for term in general_terms:
-        if term in title:
-            score += 5
-        if term in description:
-            score += 3
-    
-    return min(score, 100.0)  # Cap at 100
+    return capped_score(_RELEVANCE_TERMS, title, description, category)
+
+@lru_cache(maxsize=64)
+def _search_terms_matcher(terms: Tuple[str, ...]):
+    """Compiled +15/+8 matcher for a search-term set, built once per distinct set."""
+    return compile_terms((term, 15, 8) for term in terms)
+
+_DEFAULT_SEARCH_TERMS = ('unity', 'web', 'react', 'javascript', 'c#', 'frontend', 'backend')
 
 def calculate_web_relevance_score(title: str, description: str, search_terms: List[str] = None) -> float:
     """Calculate relevance score for web-scraped data."""
     if not search_terms:
-        search_terms = ['unity', 'web', 'react', 'javascript', 'c#', 'frontend', 'backend']
-    
-    score = 0.0
-    title_lower = title.lower()
-    description_lower = description.lower()
+        search_terms = _DEFAULT_SEARCH_TERMS
     
-    for term in search_terms:
-        if term.lower() in title_lower:
-            score += 15
-        if term.lower() in description_lower:
-            score += 8
-    
-    return min(score, 100.0)
+    return capped_score(_search_terms_matcher(tuple(sorted(search_terms))), title.lower(), description.lower())
 
 class AuthenticJobsSearcher:
     """Job searcher for Authentic Jobs using their API/web scraping."""
     
+    # Start time of the most recent search, shared by every searcher in the
+    # process so concurrent callers draw on one crawl-delay budget
+    _rate_lock = threading.Lock()
+    _last_request = float('-inf')
+    
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.console = Console()
+        # Minimum seconds between searches - their robots.txt crawl delay
+        self.crawl_delay = float(config.get('authentic_jobs_crawl_delay', 3))
+        # Config search terms, lowercased once rather than on every search
+        self._config_terms = [term.lower() for term in config.get('search_terms') or []]
+    
+    def _wait_for_crawl_delay(self):
+        """Sleep only as long as needed to keep searches crawl_delay apart."""
+        if self.crawl_delay <= 0:
+            return
+        with AuthenticJobsSearcher._rate_lock:
+            wait = AuthenticJobsSearcher._last_request + self.crawl_delay - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            AuthenticJobsSearcher._last_request = time.monotonic()
     
     def search_jobs(self, query: str) -> List[JobPosting]:
         """Search for jobs on Authentic Jobs."""
-        search_terms = query.lower().split()
-        
-        # Get search terms from config
-        if 'search_terms' in self.config:
-            search_terms.extend([term.lower() for term in self.config['search_terms']])
+        # Query words plus the search terms from config
+        search_terms = query.lower().split() + self._config_terms
         
         # Respect their robots.txt crawl delay
-        time.sleep(3)
+        self._wait_for_crawl_delay()
+        
+        # Jobs under the notification threshold are filtered out downstream
+        # anyway, so don't spend time building them
+        min_score = self.config.get('notifications', {}).get('min_relevance_score', 0)
         
-        return get_authentic_jobs(search_terms=search_terms, max_jobs=20)
+        return get_authentic_jobs(search_terms=search_terms, max_jobs=20, min_score=min_score)
+    
+    def search_jobs_batch(self, queries: List[str]) -> List[List[JobPosting]]:
+        """
+        Run several searches concurrently.
+        
+        Each search still waits out the crawl delay before starting, but its
+        request and parsing overlap the next search's wait instead of adding
+        to it. Pool size comes from config['authentic_jobs_workers'] (default 5).
+        
+        Returns:
+            One list of JobPosting objects per query, in the order given
+        """
+        workers = min(self.config.get('authentic_jobs_workers', 5), len(queries))
+        if workers <= 1:
+            return [self.search_jobs(query) for query in queries]
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.search_jobs, queries))
 
 if __name__ == "__main__":
     """Test the Authentic Jobs scraper."""
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared weighted-term matcher behind the relevance scores
+Run with: python -m pytest legacy/test_terms.py
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from job_sites._terms import capped_score, compile_terms, iter_terms
+
+def naive_score(weighted_terms, *texts_lower):
+    """The per-term `in` loop the matcher replaced, capped at 100."""
+    score = 0.0
+    for term, *weights in weighted_terms:
+        for column, text_lower in enumerate(texts_lower):
+            if term.lower() in text_lower:
+                score += weights[column]
+    return min(score, 100.0)
+
+def test_overlapping_prefixes_are_all_found():
+    matcher = compile_terms([('java', 8, 4), ('javascript', 15, 8)])
+    assert set(iter_terms(matcher, 'senior javascript developer')) == {'java', 'javascript'}
+    assert set(iter_terms(matcher, 'java developer')) == {'java'}
+    
+    matcher = compile_terms([('game', 20, 10), ('mobile game', 20, 10)])
+    assert set(iter_terms(matcher, 'mobile game studio')) == {'game', 'mobile game'}
+    assert capped_score(matcher, 'mobile game studio', '') == 40.0
+
+def test_terms_found_once_per_text():
+    matcher = compile_terms([('web', 15, 8)])
+    assert list(iter_terms(matcher, 'web web web')) == ['web']
+    assert capped_score(matcher, 'web web', 'web') == 23.0
+
+def test_duplicate_terms_sum_their_weights():
+    terms = [('react', 25, 15), ('React', 25, 15), ('react', 15, 8)]
+    matcher = compile_terms(terms)
+    assert matcher[1]['react'] == (65, 38)
+    assert capped_score(matcher, 'react', '') == naive_score(terms, 'react', '') == 65.0
+
+def test_empty_term_is_present_in_any_text():
+    terms = [('', 25, 15), ('unity', 25, 15)]
+    matcher = compile_terms(terms)
+    assert list(iter_terms(matcher, '')) == ['']
+    assert capped_score(matcher, 'frontend', 'backend') == naive_score(terms, 'frontend', 'backend') == 40.0
+    assert capped_score(compile_terms([('', 5, 3)]), '', '') == 8.0
+
+def test_score_is_capped_at_100():
+    terms = [(term, 30, 20) for term in ('unity', 'game', 'c#', 'react')]
+    matcher = compile_terms(terms)
+    assert capped_score(matcher, 'unity game c# react', 'unity game') == 100.0
+    assert capped_score(matcher, 'unity game c#', '') == 90.0
+
+def test_columns_follow_text_order():
+    matcher = compile_terms([('ui', 10, 5, 0), ('unity', 20, 10, 15)])
+    assert capped_score(matcher, 'ui', 'unity', 'unity') == 10.0 + 10.0 + 15.0
+
+def test_regex_characters_are_literal():
+    terms = [('c#', 20, 10), ('c++', 15, 8), ('.net', 15, 8)]
+    matcher = compile_terms(terms)
+    for text in ('c# and c++', 'asp.net', 'cnet c+', 'c#.net'):
+        assert capped_score(matcher, text, text) == naive_score(terms, text, text)
+
+def test_no_terms_scores_zero():
+    matcher = compile_terms([])
+    assert list(iter_terms(matcher, 'anything')) == []
+    assert capped_score(matcher, 'anything', 'at all') == 0.0
+
+def test_matches_naive_loop():
+    terms = [(term, 20, 10) for term in ('unity', 'game', 'c#', '3d', 'mobile game')] + \
+            [(term, 15, 8) for term in ('react', 'java', 'javascript', 'web', 'node')] + \
+            [('developer', 5, 3), ('dev', 5, 3), ('web', 5, 3)]
+    matcher = compile_terms(terms)
+    texts = ['', 'java', 'javascript developer', 'mobile game dev', 'web3d node.js', 'unity c# 3d game', 'devweb']
+    for title in texts:
+        for description in texts:
+            assert capped_score(matcher, title, description) == naive_score(terms, title, description)